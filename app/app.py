@@ -52,6 +52,9 @@ Talisman(
     },
 )
 
+# Values accepted as "enabled" for boolean feature-flag env vars
+_TRUTHY = frozenset({"true", "1", "yes", "on"})
+
 
 # Caching configuration from environment variables
 def get_cache_config():
@@ -63,17 +66,15 @@ def get_cache_config():
       - respect_dns_ttl: boolean indicating whether to clamp the cache TTL
         to the smallest DNS record TTL observed in the validation result.
     """
-    enabled = os.getenv("CACHE_ENABLED", "false").lower() in ["true", "1", "yes"]
+    enabled = os.getenv("CACHE_ENABLED", "false").strip().lower() in _TRUTHY
     backend = os.getenv("CACHE_BACKEND", "simple").lower()
     try:
         default_timeout = int(os.getenv("CACHE_DEFAULT_TIMEOUT", "300"))
     except ValueError:
         default_timeout = 300
-    respect_dns_ttl = os.getenv("CACHE_RESPECT_DNS_TTL", "true").lower() in [
-        "true",
-        "1",
-        "yes",
-    ]
+    respect_dns_ttl = (
+        os.getenv("CACHE_RESPECT_DNS_TTL", "true").strip().lower() in _TRUTHY
+    )
 
     # Map backend identifier to Flask-Caching CACHE_TYPE
     backend_map = {
@@ -126,18 +127,46 @@ limiter = Limiter(
 # Caching: initialise Flask-Caching with the configured backend. When the
 # feature flag is disabled we still create a NullCache instance so that the
 # cache API can be invoked unconditionally throughout the code base.
-_cache_config, CACHE_ENABLED, CACHE_RESPECT_DNS_TTL = get_cache_config()
-try:
-    cache = Cache(app, config=_cache_config)
-except Exception as _cache_init_exc:  # pylint: disable=broad-except
-    # Fall back to NullCache when the requested backend cannot be constructed
-    # (e.g. CACHE_BACKEND=redis but the redis package is not installed).
-    logging.getLogger(__name__).warning(
-        "Failed to initialise cache backend %s: %s. Falling back to NullCache.",
-        _cache_config.get("CACHE_TYPE"),
-        _cache_init_exc,
-    )
-    cache = Cache(app, config={"CACHE_TYPE": "NullCache"})
+cache = Cache()
+
+
+class CacheSettings:
+    """Active validation cache settings, replaced by configure_cache()."""
+
+    def __init__(self):
+        self.config = {"CACHE_TYPE": "NullCache"}
+        self.enabled = False
+        self.respect_dns_ttl = True
+
+
+cache_settings = CacheSettings()
+
+
+def configure_cache():
+    """(Re)initialise the validation cache from the environment.
+
+    Runs once at import; tests call it again after changing ``CACHE_*``
+    variables rather than reloading the whole module.
+    """
+    config, enabled, respect_dns_ttl = get_cache_config()
+    cache_settings.config = config
+    cache_settings.enabled = enabled
+    cache_settings.respect_dns_ttl = respect_dns_ttl
+    try:
+        cache.init_app(app, config=config)
+    except Exception as exc:  # pylint: disable=broad-except
+        # Fall back to NullCache when the requested backend cannot be
+        # constructed (e.g. CACHE_BACKEND=redis but the redis package is not
+        # installed).
+        logging.getLogger(__name__).warning(
+            "Failed to initialise cache backend %s: %s. Falling back to NullCache.",
+            config.get("CACHE_TYPE"),
+            exc,
+        )
+        cache.init_app(app, config={"CACHE_TYPE": "NullCache"})
+
+
+configure_cache()
 
 
 # Cache hit/miss statistics. These counters are in-process and reset whenever
@@ -181,10 +210,10 @@ class CacheStats:
             total = self.hits + self.misses
             hit_ratio = (self.hits / total) if total else 0.0
             return {
-                "enabled": CACHE_ENABLED,
-                "backend": _cache_config.get("CACHE_TYPE", "NullCache"),
-                "default_timeout": _cache_config.get("CACHE_DEFAULT_TIMEOUT"),
-                "respect_dns_ttl": CACHE_RESPECT_DNS_TTL,
+                "enabled": cache_settings.enabled,
+                "backend": cache_settings.config.get("CACHE_TYPE", "NullCache"),
+                "default_timeout": cache_settings.config.get("CACHE_DEFAULT_TIMEOUT"),
+                "respect_dns_ttl": cache_settings.respect_dns_ttl,
                 "hits": self.hits,
                 "misses": self.misses,
                 "sets": self.sets,
@@ -251,8 +280,8 @@ def _extract_min_dns_ttl(result):
 
 def _resolve_timeout(result):
     """Pick the effective cache timeout for a validation result."""
-    default_timeout = _cache_config.get("CACHE_DEFAULT_TIMEOUT", 300)
-    if not CACHE_RESPECT_DNS_TTL:
+    default_timeout = cache_settings.config.get("CACHE_DEFAULT_TIMEOUT", 300)
+    if not cache_settings.respect_dns_ttl:
         return default_timeout
     min_ttl = _extract_min_dns_ttl(result)
     if min_ttl is None:
@@ -273,7 +302,7 @@ def validate_with_cache(domain, request_type, validator_fn):
     Returns:
         The validation result, either from cache or freshly produced.
     """
-    if not CACHE_ENABLED:
+    if not cache_settings.enabled:
         return validator_fn()
 
     key = _cache_key(domain, request_type)
@@ -411,22 +440,32 @@ logger.debug(f"Log file: {os.getenv('LOG_FILE', 'None - console only')}")
 
 
 # BondIT attribution configuration
-def show_attribution():
-    """Check if BondIT attribution footer should be shown"""
-    attribution = os.getenv("SHOW_BONDIT_ATTRIBUTION", "true").lower()
-    return attribution in ["true", "1", "yes"]  # Support true, 1, yes for flexibility
+def show_attribution(env=None):
+    """Check if BondIT attribution footer should be shown
+
+    Args:
+        env (Mapping[str, str]): Mapping to read the setting from; defaults
+            to ``os.environ``
+    """
+    env = os.environ if env is None else env
+    attribution = env.get("SHOW_BONDIT_ATTRIBUTION", "true").strip().lower()
+    return attribution in _TRUTHY
+
+
+# Resolved once at startup; the environment does not change at runtime
+SHOW_ATTRIBUTION = show_attribution()
 
 
 def show_domain_check_history():
     """Check if domain-specific validation history is enabled"""
-    flag = os.getenv("SHOW_DOMAIN_CHECK_HISTORY", "false").lower()
-    return flag in ["true", "1", "yes"]
+    flag = os.getenv("SHOW_DOMAIN_CHECK_HISTORY", "false").strip().lower()
+    return flag in _TRUTHY
 
 
 # Google Analytics configuration
 def get_analytics_config():
     """Get Google Analytics configuration with validation"""
-    ga_enabled = os.getenv("GA_ENABLED", "false").lower() in ["true", "1", "yes"]
+    ga_enabled = os.getenv("GA_ENABLED", "false").strip().lower() in _TRUTHY
     ga_tracking_id = os.getenv("GA_TRACKING_ID", "")
 
     # Validate configuration
@@ -448,7 +487,7 @@ def get_analytics_config():
 @app.context_processor
 def inject_attribution():
     """Make attribution setting available to all templates"""
-    return {"show_attribution": show_attribution()}
+    return {"show_attribution": SHOW_ATTRIBUTION}
 
 
 @app.context_processor
@@ -579,13 +618,33 @@ def log_request(response):
     return response
 
 
+# Emit compact JSON from API responses (bulk responses carry up to 50 results)
+app.config.setdefault("RESTX_JSON", {"separators": (",", ":")})
+# Validate request payloads against their models unless a model opts out
+app.config.setdefault("RESTX_VALIDATE", True)
+
+
+def api_docs_enabled(env=None):
+    """Check if the Swagger UI and swagger.json should be served
+
+    Args:
+        env (Mapping[str, str]): Mapping to read the setting from; defaults
+            to ``os.environ``
+    """
+    env = os.environ if env is None else env
+    return env.get("API_DOCS_ENABLED", "true").strip().lower() in _TRUTHY
+
+
+API_DOCS_ENABLED = api_docs_enabled()
+
 # Initialize Flask-RESTX
 api = Api(
     app,
     version="1.0",
     title="DNSSEC Validator API",
     description="A comprehensive DNSSEC validation service that checks domain security",
-    doc="/api/docs/",
+    doc="/api/docs/" if API_DOCS_ENABLED else False,
+    add_specs=API_DOCS_ENABLED,
     prefix="/api",
 )
 
@@ -1131,7 +1190,7 @@ class DNSSECDetailedValidation(Resource):
 @ns_validate.route("/bulk")
 class DNSSECBulkValidation(Resource):
     @ns_validate.doc("validate_bulk_domains")
-    @ns_validate.expect(bulk_request_model, validate=True)
+    @ns_validate.expect(bulk_request_model)
     @ns_validate.response(
         200, "Success - Bulk validation completed", bulk_response_model
     )
@@ -1179,9 +1238,9 @@ class DNSSECBulkValidation(Resource):
         start_time = time.time()
 
         try:
-            # Parse request body
-            data = request.get_json()
-            if not data:
+            # Parse request body; malformed JSON is treated as a missing body
+            data = request.get_json(silent=True)
+            if not data or not isinstance(data, dict):
                 return {
                     "error": "Request body is required",
                     "details": "Expected JSON with 'domains' array",
@@ -1222,13 +1281,14 @@ class DNSSECBulkValidation(Resource):
                 }, 400
 
             # Import domain utilities for validation
-            from domain_utils import extract_domain_from_input, is_valid_domain_format
+            from domain_utils import normalize_domains
 
             # Pre-validate and extract domains
             validated_domains = []
             invalid_domains = []
 
-            for domain in domains:
+            # Extract domains from URLs or direct domain input in one batch
+            for domain, (extracted, _) in zip(domains, normalize_domains(domains)):
                 if not isinstance(domain, str):
                     invalid_domains.append(
                         {
@@ -1238,10 +1298,7 @@ class DNSSECBulkValidation(Resource):
                     )
                     continue
 
-                # Extract domain from URL or validate direct domain input
-                extracted = extract_domain_from_input(domain)
-
-                if not extracted or not is_valid_domain_format(extracted):
+                if not extracted:
                     invalid_domains.append(
                         {"input": domain, "reason": "Invalid domain format"}
                     )
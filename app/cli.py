@@ -16,23 +16,57 @@ def cli():
 
 
 @cli.command()
-@click.option("--days", default=90, help="Delete logs older than N days (default: 90)")
+@click.option(
+    "--days",
+    type=int,
+    default=None,
+    help="Deprecated and ignored; use --set-retention-days instead",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
-    help="Show what would be deleted without actually deleting",
+    help="Show what would change without changing anything",
 )
-def cleanup_logs(days, dry_run):
-    """Clean up old request logs from InfluxDB"""
+@click.option(
+    "--set-retention-days",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Replace the bucket retention policy with an N day expiry",
+)
+def cleanup_logs(days, dry_run, set_retention_days):
+    """Clean up old request logs from InfluxDB
+
+    InfluxDB expires old logs through the bucket retention policy, so nothing
+    is deleted unless --set-retention-days changes that policy.
+    """
+    if days is not None:
+        click.echo(
+            "Warning: --days is deprecated and ignored; "
+            "use --set-retention-days to change how long logs are kept",
+            err=True,
+        )
+
     try:
         if dry_run:
-            click.echo(f"DRY RUN: Would delete log entries older than {days} days")
+            click.echo("DRY RUN: No log entries are deleted by this command")
+            if set_retention_days:
+                click.echo(
+                    f"Would set the bucket retention policy to {set_retention_days} days"
+                )
             click.echo("Note: InfluxDB uses retention policies for automatic cleanup")
             return
 
-        # Perform actual cleanup
-        deleted = RequestLog.cleanup_old_logs(days)
-        click.echo(f"Successfully deleted {deleted} log entries older than {days} days")
+        RequestLog.cleanup_old_logs()
+        click.echo(
+            "No log entries deleted: InfluxDB expires old logs through the "
+            "bucket retention policy"
+        )
+
+        if set_retention_days:
+            if not RequestLog.set_retention_days(set_retention_days):
+                click.echo("Error: Could not update the retention policy", err=True)
+                sys.exit(1)
+            click.echo(f"Bucket retention policy set to {set_retention_days} days")
 
     except Exception as e:
         click.echo(f"Error during cleanup: {e}", err=True)
@@ -1,6 +1,8 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from functools import cached_property, lru_cache
 
 import dns.resolver
 import dns.dnssec
@@ -15,15 +17,56 @@ from tlsa_validator import TLSAValidator
 from caa_validator import CAAValidator
 from domain_utils import get_fallback_domains, has_subdomain
 
+# dns.name.Name objects are immutable, so parsed names can be shared between
+# validators (bulk requests and fallback attempts re-parse the same domains)
+_parse_name = lru_cache(maxsize=1024)(dns.name.from_text)
+
+# Runs the TLSA summary while the chain of trust is being walked. The TLSA
+# check waits on a DNS lookup and, when records exist, a TLS handshake, so it
+# is the one moved off the request thread; the CAA check stays inline
+_SUMMARY_EXECUTOR = ThreadPoolExecutor(
+    max_workers=16, thread_name_prefix="dnssec-summary"
+)
+
+# Upper bound on waiting for the TLSA summary: resolver lifetime plus the
+# 5 second TLS connect timeout, with some slack
+_SUMMARY_TIMEOUT = 12.0
+
+# Minimal TLSA summary reported when the check fails
+_TLSA_ERROR_SUMMARY = {
+    "status": "error",
+    "records_found": 0,
+    "dane_status": "error",
+    "message": "⚠️ TLSA check failed",
+}
+
 
 class DNSSECValidator:
+    # IANA root trust anchors (simplified - in production, fetch from IANA)
+    root_trust_anchors = {
+        20326: {
+            "key": "AwEAAaz/tAm8yTn4Mfeh5eyI96WSVexTBAvkMgJzkKTO...",
+            "algorithm": 8,
+            "flags": 257,
+        }
+    }
+
     def __init__(self, domain):
         self.domain = domain
-        self.domain_name = dns.name.from_text(domain)
-        self.results = {
-            "domain": domain,
+        self.domain_name = _parse_name(domain)
+        self._created_at = datetime.utcnow()
+
+    @cached_property
+    def results(self):
+        """Validation results, built on first use.
+
+        Callers that only run individual queries never touch them, so the
+        nested structure is not allocated up front.
+        """
+        return {
+            "domain": self.domain,
             "status": "unknown",
-            "validation_time": datetime.utcnow().isoformat(),
+            "validation_time": self._created_at.isoformat(),
             "chain_of_trust": [],
             "records": {"dnskey": [], "ds": [], "rrsig": []},
             "tlsa_summary": None,  # Basic TLSA info for simple validation
@@ -31,17 +74,11 @@ class DNSSECValidator:
             "errors": [],
         }
 
-        # IANA root trust anchors (simplified - in production, fetch from IANA)
-        self.root_trust_anchors = {
-            20326: {
-                "key": "AwEAAaz/tAm8yTn4Mfeh5eyI96WSVexTBAvkMgJzkKTO...",
-                "algorithm": 8,
-                "flags": 257,
-            }
-        }
-
     def validate(self):
         """Main validation method"""
+        # The basic TLSA check is independent of the chain of trust
+        tlsa_summary = _SUMMARY_EXECUTOR.submit(self._add_tlsa_summary)
+
         try:
             # Step 1: Validate from root down to domain
             chain_valid = self._validate_chain_of_trust()
@@ -58,13 +95,6 @@ class DNSSECValidator:
             self.results["status"] = "error"
             self.results["errors"].append(str(e))
 
-        # Add basic TLSA check (non-blocking)
-        try:
-            self._add_tlsa_summary()
-        except Exception as e:
-            logging.warning(f"TLSA check failed: {e}")
-            # Don't fail the overall validation for TLSA issues
-
         # Add basic CAA check (non-blocking)
         try:
             self._add_caa_summary()
@@ -72,6 +102,16 @@ class DNSSECValidator:
             logging.warning(f"CAA check failed: {e}")
             # Don't fail the overall validation for CAA issues
 
+        # Collect basic TLSA check (non-blocking)
+        try:
+            self.results["tlsa_summary"] = tlsa_summary.result(timeout=_SUMMARY_TIMEOUT)
+        except Exception as e:
+            logging.warning(f"TLSA check failed: {e!r}")
+            # Don't fail the overall validation for TLSA issues. A still
+            # queued check is dropped; a running one only builds its summary
+            tlsa_summary.cancel()
+            self.results["tlsa_summary"] = dict(_TLSA_ERROR_SUMMARY)
+
         return self.results
 
     def validate_with_fallback(self, original_input=None):
@@ -855,7 +895,11 @@ class DNSSECValidator:
         return status_messages.get(status, "❓ TLSA status unknown")
 
     def _add_tlsa_summary(self):
-        """Add basic TLSA summary to simple validation results"""
+        """Build the basic TLSA summary for simple validation results
+
+        Runs on a summary worker, so it returns the summary for validate()
+        to store instead of writing into the shared results.
+        """
         try:
             tlsa_validator = TLSAValidator(self.domain)
             tlsa_result = tlsa_validator.validate_tlsa(timeout=5)  # Quick check
@@ -885,17 +929,12 @@ class DNSSECValidator:
             else:
                 summary["message"] = "❓ TLSA status unknown"
 
-            self.results["tlsa_summary"] = summary
+            return summary
 
         except Exception as e:
             logging.debug(f"TLSA summary generation failed: {e}")
-            # Set minimal summary on error
-            self.results["tlsa_summary"] = {
-                "status": "error",
-                "records_found": 0,
-                "dane_status": "error",
-                "message": "⚠️ TLSA check failed",
-            }
+            # Minimal summary on error
+            return dict(_TLSA_ERROR_SUMMARY)
 
     def _add_caa_summary(self):
         """Add basic CAA summary to simple validation results"""
@@ -9,6 +9,7 @@ conversion (the standard library ``idna`` codec only supports IDNA 2003).
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 import logging
 
@@ -20,6 +21,26 @@ logger = logging.getLogger(__name__)
 # always begin with the ACE prefix "xn--" (case-insensitive).
 _ACE_PREFIX = "xn--"
 
+# Characters that only appear in URL-shaped input (scheme, path, port,
+# query, fragment). Input without any of them is already a bare domain.
+_URL_CHARS = frozenset("/:?#")
+
+# First delimiter ending a URL's host part; one C-level scan instead of a
+# str.find per delimiter
+_HOST_END_RE = re.compile(r"[/?#]")
+
+# Size of the per-function memo caches below. These helpers are pure
+# string -> value transforms, so repeated domains (within a bulk request or
+# across requests) are served from the cache.
+_CACHE_SIZE = 4096
+
+# Basic domain validation regex, compiled once at import.
+# Allows letters, numbers, hyphens, dots. Punycode labels are accepted
+# via the general ``[a-z0-9-]`` character class (they start with ``xn--``).
+_DOMAIN_RE = re.compile(
+    r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)*\.[a-z0-9-]{2,}$"
+)
+
 
 class IDNConversionError(ValueError):
     """Raised when an internationalized domain name cannot be encoded/decoded."""
@@ -27,13 +48,9 @@ class IDNConversionError(ValueError):
 
 def _contains_non_ascii(value):
     """Return True if *value* contains any non-ASCII character."""
-    if not value:
-        return False
-    try:
-        value.encode("ascii")
-    except UnicodeEncodeError:
-        return True
-    return False
+    # str.isascii() reads a flag CPython keeps on every str, so this is O(1)
+    # and avoids encoding a throwaway bytes copy
+    return bool(value) and not value.isascii()
 
 
 def to_ascii(domain):
@@ -123,6 +140,7 @@ def normalize_idn_domain(domain):
     return {"unicode": unicode_form, "ascii": ascii_form}
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def extract_domain_from_input(user_input):
     """
     Extract domain name from user input which might be:
@@ -148,14 +166,28 @@ def extract_domain_from_input(user_input):
 
     domain = None
 
-    # If it looks like a URL, parse it
-    if user_input.startswith(("http://", "https://", "ftp://")):
-        try:
-            parsed = urlparse(user_input)
-            if parsed.hostname:
-                domain = parsed.hostname
-        except Exception as e:  # pylint: disable=broad-except
-            logger.debug("Failed to parse URL %s: %s", user_input, e)
+    # Fast path: plain domains skip URL parsing and component stripping
+    if _URL_CHARS.isdisjoint(user_input):
+        domain = user_input
+
+    # If it looks like a URL, take the host between the scheme and the first
+    # path/query/fragment delimiter
+    elif user_input.startswith(("http://", "https://", "ftp://")):
+        rest = user_input[user_input.index("://") + 3 :]
+        match = _HOST_END_RE.search(rest)
+        netloc = rest[: match.start()] if match else rest
+
+        if "@" in netloc or "[" in netloc:
+            # Credentials or IPv6 literals: leave those to urlparse
+            try:
+                parsed = urlparse(user_input)
+                if parsed.hostname:
+                    domain = parsed.hostname
+            except Exception as e:  # pylint: disable=broad-except
+                logger.debug("Failed to parse URL %s: %s", user_input, e)
+        else:
+            # Remove port if present
+            domain = netloc.split(":", 1)[0] or None
 
     # If it contains protocol-like patterns but isn't a valid URL, try to extract
     if domain is None and "://" in user_input:
@@ -196,6 +228,7 @@ def extract_domain_from_input(user_input):
     return ascii_domain if is_valid_domain_format(ascii_domain) else None
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def is_valid_domain_format(domain):
     """
     Check if a string has a valid domain format.
@@ -217,11 +250,6 @@ def is_valid_domain_format(domain):
     if _contains_non_ascii(domain):
         return False
 
-    # Basic domain validation regex
-    # Allows letters, numbers, hyphens, dots. Punycode labels are accepted
-    # via the general ``[a-z0-9-]`` character class (they start with ``xn--``).
-    domain_pattern = r"^[a-z0-9]([a-z0-9-]*[a-z0-9])?(\.[a-z0-9]([a-z0-9-]*[a-z0-9])?)*\.[a-z0-9-]{2,}$"
-
     return (
         len(domain) <= 253  # RFC limit
         and "." in domain  # Must have at least one dot
@@ -230,10 +258,11 @@ def is_valid_domain_format(domain):
             "."
         )  # Can't end with dot (we'll handle root zones separately)
         and ".." not in domain  # No consecutive dots
-        and re.match(domain_pattern, domain) is not None
+        and _DOMAIN_RE.match(domain) is not None
     )
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def extract_root_domain(domain):
     """
     Extract root domain from a subdomain.
@@ -288,6 +317,7 @@ def extract_root_domain(domain):
     return root_candidate if is_valid_domain_format(root_candidate) else domain
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def has_subdomain(domain):
     """
     Check if a domain has subdomains.
@@ -308,6 +338,7 @@ def has_subdomain(domain):
     return len(parts) > 2
 
 
+@lru_cache(maxsize=_CACHE_SIZE)
 def normalize_domain_input(user_input):
     """
     Normalize user input to extract and clean domain name.
@@ -346,6 +377,30 @@ def normalize_domain_input(user_input):
     return domain, input_type
 
 
+def normalize_domains(inputs):
+    """
+    Normalize a batch of user inputs in a single pass.
+
+    Duplicate inputs are normalized once and share the result. Non-string
+    entries are reported as invalid rather than raising.
+
+    Args:
+        inputs (list): Raw user inputs
+
+    Returns:
+        list: ``(normalized_domain, original_input_type)`` tuples, in the same
+            order as *inputs* (see :func:`normalize_domain_input`)
+    """
+    unique = dict.fromkeys(value for value in inputs if isinstance(value, str))
+    for value in unique:
+        unique[value] = normalize_domain_input(value)
+
+    return [
+        unique[value] if isinstance(value, str) else (None, "invalid")
+        for value in inputs
+    ]
+
+
 def get_fallback_domains(domain):
     """
     Get list of domains to try in fallback order.
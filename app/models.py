@@ -1,11 +1,178 @@
+import atexit
 import os
+import threading
+import time
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from functools import lru_cache
+from typing import Optional, List, Dict, Any, Tuple
 
-from influxdb_client import InfluxDBClient, Point
+from influxdb_client import BucketRetentionRules, InfluxDBClient
 from influxdb_client.client.query_api import QueryApi
 from influxdb_client.client.write_api import SYNCHRONOUS
+from influxdb_client.rest import ApiException
+from urllib3.exceptions import HTTPError
+
+# Upper bound on buffered points; the oldest are dropped if InfluxDB is down
+_MAX_BUFFERED_POINTS = 10_000
+
+# Shortest wait between background flushes, in seconds
+_MIN_FLUSH_INTERVAL = 0.1
+
+# Shortest retention period InfluxDB accepts for a bucket (0 means forever)
+_MIN_RETENTION_SECONDS = 3600
+
+# Seconds to wait before retrying a failed InfluxDB connection
+_CLIENT_RETRY_INTERVAL = 30.0
+
+# Clock for the reconnect backoff; tests replace this instead of time.monotonic
+_monotonic = time.monotonic
+
+
+def _is_transient_write_error(error: Exception) -> bool:
+    """Whether a failed write may succeed if retried
+
+    Connection failures and server errors (5xx) can clear up; any other
+    response means InfluxDB rejected the data and would do so again.
+    """
+    if isinstance(error, ApiException):
+        return error.status is not None and error.status >= 500
+    return isinstance(error, (HTTPError, OSError))
+
+
+def _env_number(name: str, default, cast=int):
+    """Read a numeric environment variable, falling back to *default*"""
+    try:
+        return cast(os.getenv(name, str(default)))
+    except ValueError:
+        return default
+
+
+# Line protocol escaping, matching influxdb_client's Point serializer
+_ESCAPE_TAG = str.maketrans(
+    {",": r"\,", "=": r"\=", " ": r"\ ", "\n": r"\n", "\t": r"\t", "\r": r"\r"}
+)
+_ESCAPE_STRING = str.maketrans({'"': r"\"", "\\": r"\\"})
+
+
+def _lp_tag(key: str, value: str) -> str:
+    """Format one ``,key=value`` tag pair, or nothing for an empty value"""
+    if not value:
+        return ""
+    value = value.translate(_ESCAPE_TAG)
+    if value.endswith("\\"):
+        value += " "
+    return f",{key}={value}"
+
+
+# Prebuilt tag fragments for the low-cardinality tags
+_LP_CLIENT_TAGS = {"webapp": ",client=webapp", "external": ",client=external"}
+_LP_INTERNAL_TAGS = {True: ",internal=true", False: ",internal=false"}
+
+
+def _lp_format(
+    ip_address: str,
+    domain: str,
+    http_status: int,
+    dnssec_status: str,
+    source: str,
+    user_agent: Optional[str],
+    client: str,
+    request_type: Optional[str],
+    internal: bool,
+    timestamp_ns: int,
+) -> str:
+    """Serialize one request log entry as InfluxDB line protocol
+
+    The schema is fixed, so the line is built directly instead of through a
+    Point; tags and fields are emitted in sorted key order like Point does.
+    """
+    tags = "".join(
+        (
+            _LP_CLIENT_TAGS.get(client) or _lp_tag("client", client),
+            _lp_tag("dnssec_status", dnssec_status),
+            _lp_tag("domain", domain),
+            _LP_INTERNAL_TAGS[bool(internal)],
+            _lp_tag("ip_address", ip_address),
+            _lp_tag("request_type", request_type),
+            _lp_tag("source", source),
+        )
+    )
+    fields = f"count=1i,http_status={http_status}i"
+    if user_agent:
+        fields += f',user_agent="{user_agent.translate(_ESCAPE_STRING)}"'
+    return f"request{tags} {fields} {timestamp_ns}"
+
+
+@lru_cache(maxsize=1024)
+def _format_time_bucket(time_obj: datetime, date_only: bool) -> str:
+    """Format a window start as YYYY-MM-DD or a full ISO timestamp
+
+    Window boundaries repeat across dashboard refreshes, so the formatted
+    strings are cached rather than rebuilt for every record.
+    """
+    if date_only:
+        return time_obj.strftime("%Y-%m-%d")
+    return time_obj.isoformat()
+
+
+@lru_cache(maxsize=128)
+def _request_count_query(
+    bucket: str, time_range: str, include_internal: bool, source: Optional[str]
+) -> str:
+    """Flux query selecting request counts, before any domain filter
+
+    Cached per parameter combination; all arguments come from code or integer
+    periods, so user-supplied domains are appended by the caller instead.
+    """
+    flux_query = f"""
+                from(bucket: "{bucket}")
+                |> range(start: {time_range})
+                |> filter(fn: (r) => r._measurement == "request")
+                |> filter(fn: (r) => r._field == "count")
+                |> filter(fn: (r) => r.domain != "unknown")
+            """
+
+    # Filter out internal requests for stats dashboard
+    if not include_internal:
+        flux_query += '|> filter(fn: (r) => r.internal == "false")'
+
+    if source:
+        flux_query += f'|> filter(fn: (r) => r.source == "{source}")'
+
+    return flux_query
+
+
+@dataclass(frozen=True)
+class InfluxConfig:
+    """InfluxDB connection and batching settings"""
+
+    url: str = "http://localhost:8086"
+    token: str = "dev-token"
+    org: str = "dnssec-validator"
+    bucket: str = "requests"
+    batch_size: int = 100
+    flush_interval: float = 1.0
+
+    def __post_init__(self):
+        # A zero or negative wait would make the flusher thread spin
+        if self.flush_interval < _MIN_FLUSH_INTERVAL:
+            object.__setattr__(self, "flush_interval", _MIN_FLUSH_INTERVAL)
+
+    @classmethod
+    def from_env(cls) -> "InfluxConfig":
+        """Read settings from INFLUX_* environment variables"""
+        return cls(
+            url=os.getenv("INFLUX_URL", cls.url),
+            token=os.getenv("INFLUX_TOKEN", cls.token),
+            org=os.getenv("INFLUX_ORG", cls.org),
+            bucket=os.getenv("INFLUX_BUCKET", cls.bucket),
+            batch_size=_env_number("INFLUX_BATCH_SIZE", cls.batch_size),
+            flush_interval=_env_number(
+                "INFLUX_FLUSH_INTERVAL", cls.flush_interval, float
+            ),
+        )
 
 
 @dataclass
@@ -21,49 +188,190 @@ class RequestLogEntry:
     timestamp: Optional[datetime] = None
 
 
+class _BatchWriter:
+    """Buffers a logger's line-protocol entries for a background flusher
+
+    Points are written in batches of the logger's batch_size, or every
+    flush_interval seconds.
+    """
+
+    def __init__(self, logger: "InfluxDBLogger"):
+        self._logger = logger
+        self._queue = deque(maxlen=_MAX_BUFFERED_POINTS)
+        self._flush_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def enqueue(self, line: str):
+        """Buffer a line-protocol entry for the background flusher"""
+        self._queue.append(line)
+        # Started lazily, so each forked worker process runs its own flusher
+        with self._start_lock:
+            if self._stop.is_set():
+                # Closed: whatever is still buffered goes out with close()
+                return
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="influx-flush", daemon=True
+                )
+                self._thread.start()
+        if len(self._queue) >= self._logger.config.batch_size:
+            self._wakeup.set()
+
+    def _run(self):
+        """Flush buffered points when a batch fills up or the interval passes"""
+        while not self._stop.is_set():
+            self._wakeup.wait(self._logger.config.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def flush(self) -> bool:
+        """Write all buffered points to InfluxDB, batch_size points per call
+
+        Batches that fail on the connection or a server error stay buffered
+        for the next flush; batches InfluxDB rejects are dropped.
+        """
+        logger = self._logger
+        batch_size = max(1, logger.config.batch_size)
+        written = True
+        with self._flush_lock:
+            # While the client is unavailable or backing off, keep the
+            # buffer for a later flush
+            if self._queue and not logger.write_api:
+                return False
+            while self._queue:
+                batch = [
+                    self._queue.popleft()
+                    for _ in range(min(batch_size, len(self._queue)))
+                ]
+                try:
+                    # One newline-joined payload is encoded once by the
+                    # client, rather than serialized line by line
+                    logger.write_api.write(
+                        bucket=logger.bucket, org=logger.org, record="\n".join(batch)
+                    )
+                except Exception as e:
+                    written = False
+                    if not _is_transient_write_error(e):
+                        print(
+                            f"Dropping {len(batch)} request logs rejected by InfluxDB: {e}"
+                        )
+                        continue
+                    print(f"Error writing {len(batch)} request logs to InfluxDB: {e}")
+                    # Keep the batch for the next flush; if the buffer is
+                    # full, the newest entries are the ones dropped
+                    self._queue.extendleft(reversed(batch))
+                    logger._disconnect()
+                    break
+        return written
+
+    def close(self):
+        """Stop the flusher thread and write out what is still buffered"""
+        with self._start_lock:
+            self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+        self.flush()
+
+
 class InfluxDBLogger:
     """InfluxDB client for logging requests and analytics"""
 
-    def __init__(self):
-        self.url = os.getenv("INFLUX_URL", "http://localhost:8086")
-        self.token = os.getenv("INFLUX_TOKEN", "dev-token")
-        self.org = os.getenv("INFLUX_ORG", "dnssec-validator")
-        self.bucket = os.getenv("INFLUX_BUCKET", "requests")
+    def __init__(self, config: Optional[InfluxConfig] = None):
+        # Settings are parsed once; without an explicit config they come
+        # from the environment at construction time
+        self.config = config or InfluxConfig.from_env()
+
+        # Request points are buffered and written in batches of batch_size,
+        # or every flush_interval seconds; a batch size of 1 or less writes
+        # every request immediately
+        self._batcher = _BatchWriter(self)
 
-        # Initialize client (will be lazy-loaded)
+        # Initialize client (will be lazy-loaded); the flusher thread and
+        # request threads share it
+        self._client_lock = threading.RLock()
         self._client = None
+        self._client_checked_at = None
         self._write_api = None
         self._query_api = None
 
+    @property
+    def url(self) -> str:
+        return self.config.url
+
+    @property
+    def token(self) -> str:
+        return self.config.token
+
+    @property
+    def org(self) -> str:
+        return self.config.org
+
+    @property
+    def bucket(self) -> str:
+        return self.config.bucket
+
     @property
     def client(self) -> InfluxDBClient:
         """Lazy-load InfluxDB client"""
         if self._client is None:
-            try:
-                self._client = InfluxDBClient(
-                    url=self.url, token=self.token, org=self.org
-                )
-                # Test connection
-                health = self._client.health()
-                if health.status != "pass":
-                    print(f"InfluxDB health check failed: {health.message}")
-            except Exception as e:
-                print(f"Failed to connect to InfluxDB: {e}")
-                self._client = None
+            with self._client_lock:
+                if self._client is None:
+                    self._connect()
         return self._client
 
+    def _connect(self):
+        """Create the client, unless a recent attempt failed"""
+        # Don't re-probe an unreachable server on every logged request
+        now = _monotonic()
+        if (
+            self._client_checked_at is not None
+            and now - self._client_checked_at < _CLIENT_RETRY_INTERVAL
+        ):
+            return
+        self._client_checked_at = now
+        try:
+            # One long-lived client keeps its urllib3 connection pool warm
+            # across batches; gzip shrinks line-protocol writes and
+            # query CSV responses on the wire
+            self._client = InfluxDBClient(
+                url=self.url, token=self.token, org=self.org, enable_gzip=True
+            )
+            # Test connection
+            health = self._client.health()
+            if health.status != "pass":
+                print(f"InfluxDB health check failed: {health.message}")
+        except Exception as e:
+            print(f"Failed to connect to InfluxDB: {e}")
+            self._client = None
+
+    def _disconnect(self):
+        """Drop the client after a failed write so reconnects back off"""
+        with self._client_lock:
+            self._client = None
+            self._write_api = None
+            self._query_api = None
+            self._client_checked_at = _monotonic()
+
     @property
     def write_api(self):
         """Get write API"""
-        if self._write_api is None and self.client:
-            self._write_api = self.client.write_api(write_options=SYNCHRONOUS)
+        if self._write_api is None:
+            with self._client_lock:
+                if self._write_api is None and self.client:
+                    self._write_api = self.client.write_api(write_options=SYNCHRONOUS)
         return self._write_api
 
     @property
     def query_api(self) -> Optional[QueryApi]:
         """Get query API"""
-        if self._query_api is None and self.client:
-            self._query_api = self.client.query_api()
+        if self._query_api is None:
+            with self._client_lock:
+                if self._query_api is None and self.client:
+                    self._query_api = self.client.query_api()
         return self._query_api
 
     def log_request(
@@ -92,49 +400,53 @@ class InfluxDBLogger:
             if client_tag not in ["webapp", "external"]:
                 client_tag = "external"
 
-            # Create point for time-series data
-            point = (
-                Point("request")
-                .tag("domain", domain)
-                .tag("source", source)
-                .tag("client", client_tag)
-                .tag("dnssec_status", dnssec_status)
-                .tag("ip_address", ip_address)
-                .tag("internal", str(internal).lower())  # Add internal tag
-                .field("http_status", http_status)
-                .field("count", 1)
+            # Stamp the entry now; buffered lines may be written a while later
+            line = _lp_format(
+                ip_address,
+                domain,
+                http_status,
+                dnssec_status,
+                source,
+                user_agent[:500] if user_agent else None,  # Limit length
+                client_tag,
+                request_type,
+                internal,
+                time.time_ns(),
             )
 
-            # Add request_type tag if provided (basic vs detailed analysis)
-            if request_type:
-                point = point.tag("request_type", request_type)
-
-            # Add user agent as field if provided (can be large)
-            if user_agent:
-                point = point.field("user_agent", user_agent[:500])  # Limit length
-
-            # Write point to InfluxDB
-            self.write_api.write(bucket=self.bucket, org=self.org, record=point)
+            if self.config.batch_size <= 1:
+                self.write_api.write(bucket=self.bucket, org=self.org, record=line)
+            else:
+                self._batcher.enqueue(line)
             return True
 
         except Exception as e:
             print(f"Error logging request to InfluxDB: {e}")
             return False
 
-    def _execute_query(self, flux_query: str) -> List[Dict[str, Any]]:
-        """Execute Flux query and return results"""
+    def flush(self) -> bool:
+        """Write all buffered points to InfluxDB"""
+        return self._batcher.flush()
+
+    def _execute_query(
+        self, flux_query: str, columns: Optional[Tuple[str, ...]] = None
+    ) -> List[Any]:
+        """Execute Flux query and return results
+
+        With *columns*, each record is reduced to a tuple of those values as
+        it is streamed, so callers unpack rows instead of indexing dicts.
+        """
         try:
             if not self.query_api:
                 return []
 
-            tables = self.query_api.query(flux_query, org=self.org)
-            results = []
-
-            for table in tables:
-                for record in table.records:
-                    results.append(record.values)
+            # Stream records straight off the CSV response instead of building
+            # the FluxTable graph first
+            records = self.query_api.query_stream(flux_query, org=self.org)
+            if columns is None:
+                return [record.values for record in records]
 
-            return results
+            return [tuple(map(record.values.get, columns)) for record in records]
 
         except Exception as e:
             print(f"Error executing query: {e}")
@@ -158,22 +470,9 @@ class InfluxDBLogger:
             else:
                 time_range = "-30d"  # Default to 30 days
 
-            # Build query
-            flux_query = f"""
-                from(bucket: "{self.bucket}")
-                |> range(start: {time_range})
-                |> filter(fn: (r) => r._measurement == "request")
-                |> filter(fn: (r) => r._field == "count")
-                |> filter(fn: (r) => r.domain != "unknown")
-            """
-
-            # Filter out internal requests for stats dashboard
-            if not include_internal:
-                flux_query += '|> filter(fn: (r) => r.internal == "false")'
-
-            # Add source filter if specified
-            if source:
-                flux_query += f'|> filter(fn: (r) => r.source == "{source}")'
+            flux_query = _request_count_query(
+                self.bucket, time_range, include_internal, source
+            )
 
             # Add domain filter if specified
             if domain:
@@ -207,32 +506,19 @@ class InfluxDBLogger:
         try:
             time_range = f"-{hours}h" if hours else (f"-{days}d" if days else "-30d")
 
-            flux_query = f"""
-                from(bucket: "{self.bucket}")
-                |> range(start: {time_range})
-                |> filter(fn: (r) => r._measurement == "request")
-                |> filter(fn: (r) => r._field == "count")
-                |> filter(fn: (r) => r.domain != "unknown")
-            """
-
-            # Filter out internal requests for stats dashboard
-            if not include_internal:
-                flux_query += '|> filter(fn: (r) => r.internal == "false")'
-
             # Only API validations for top domains by default
-            if source:
-                flux_query += f'|> filter(fn: (r) => r.source == "{source}")'
-
+            flux_query = _request_count_query(
+                self.bucket, time_range, include_internal, source
+            )
             flux_query += f"""
                 |> group(columns: ["domain"])
                 |> sum()
                 |> group()
-                |> sort(columns: ["_value"], desc: true)
-                |> limit(n: {limit})
+                |> top(n: {limit}, columns: ["_value"])
             """
 
-            results = self._execute_query(flux_query)
-            return [(r.get("domain"), int(r.get("_value", 0))) for r in results]
+            rows = self._execute_query(flux_query, columns=("domain", "_value"))
+            return [(domain, int(value or 0)) for domain, value in rows]
 
         except Exception as e:
             print(f"Error getting top domains: {e}")
@@ -315,21 +601,10 @@ class InfluxDBLogger:
     ) -> List[tuple]:
         """Get request counts aggregated by a dynamic window. Returns list of (ISO timestamp, count)."""
         try:
-            flux_query = f"""
-                from(bucket: "{self.bucket}")
-                |> range(start: -{hours}h)
-                |> filter(fn: (r) => r._measurement == "request")
-                |> filter(fn: (r) => r._field == "count")
-                |> filter(fn: (r) => r.domain != "unknown")
-            """
-
-            # Filter out internal requests for stats dashboard
-            if not include_internal:
-                flux_query += '|> filter(fn: (r) => r.internal == "false")'
-
             # Only API by default
-            if source:
-                flux_query += f'|> filter(fn: (r) => r.source == "{source}")'
+            flux_query = _request_count_query(
+                self.bucket, f"-{hours}h", include_internal, source
+            )
 
             # Add domain filter if specified
             if domain:
@@ -342,22 +617,17 @@ class InfluxDBLogger:
                 |> yield()
             """
 
-            results = self._execute_query(flux_query)
+            rows = self._execute_query(flux_query, columns=("_time", "_value"))
             series = []
             # For day-based windows (7d, 30d), format as date-only
-            use_date_only = window_every == "1d" or (hours and hours >= 168)  # 7+ days
+            use_date_only = bool(
+                window_every == "1d" or (hours and hours >= 168)  # 7+ days
+            )
 
-            for r in results:
-                if r.get("_time"):
-                    time_obj = r.get("_time")
-                    if use_date_only:
-                        # Return date only in YYYY-MM-DD format
-                        ts = time_obj.strftime("%Y-%m-%d")
-                    else:
-                        # Return full ISO timestamp for hourly/shorter periods
-                        ts = time_obj.isoformat()
-                    value = int(r.get("_value", 0))
-                    series.append((ts, value))
+            for time_obj, value in rows:
+                if time_obj:
+                    ts = _format_time_bucket(time_obj, use_date_only)
+                    series.append((ts, int(value or 0)))
             # Sort by timestamp
             return sorted(series, key=lambda x: x[0])
 
@@ -403,14 +673,50 @@ class InfluxDBLogger:
             return []
 
     def cleanup_old_logs(self, days: int = None) -> int:
-        """InfluxDB handles retention automatically, but we can delete old data manually"""
-        # InfluxDB 2.x uses retention policies automatically
-        # This is mainly for compatibility with the CLI interface
+        """InfluxDB expires old data through the bucket retention policy
+
+        Nothing is deleted here, so the returned count is always 0; *days* is
+        deprecated and ignored, use set_retention_days() to change the policy.
+        """
+        if days is not None:
+            print(
+                f"Ignoring days={days}: use set_retention_days() to change how long logs are kept."
+            )
         print(
-            f"InfluxDB retention is handled automatically. Configured for {days or '90'} days."
+            "InfluxDB retention is handled automatically by the bucket retention policy."
         )
         return 0
 
+    def set_retention_days(self, days: int) -> bool:
+        """Replace the bucket retention rule with a *days* expiry"""
+        try:
+            every_seconds = days * 24 * 60 * 60
+            if every_seconds < _MIN_RETENTION_SECONDS:
+                print(
+                    f"Retention must be at least {_MIN_RETENTION_SECONDS // 3600} hour"
+                )
+                return False
+
+            if not self.client:
+                print("InfluxDB client not available")
+                return False
+
+            buckets_api = self.client.buckets_api()
+            bucket = buckets_api.find_bucket_by_name(self.bucket)
+            if not bucket:
+                print(f"Bucket {self.bucket} not found")
+                return False
+
+            bucket.retention_rules = [
+                BucketRetentionRules(type="expire", every_seconds=every_seconds)
+            ]
+            buckets_api.update_bucket(bucket=bucket)
+            return True
+
+        except Exception as e:
+            print(f"Error updating retention policy: {e}")
+            return False
+
     def truncate_database(self) -> bool:
         """Truncate all data from the bucket (dangerous operation)"""
         try:
@@ -461,8 +767,6 @@ class InfluxDBLogger:
                 print(f"Bucket '{self.bucket}' not found or already deleted: {e}")
 
             # Create new bucket
-            from influxdb_client import BucketRetentionRules
-
             # Set up retention rules (default 90 days)
             retention_rules = BucketRetentionRules(
                 type="expire", every_seconds=90 * 24 * 60 * 60  # 90 days in seconds
@@ -540,13 +844,16 @@ class InfluxDBLogger:
             return {"error": f"Error getting database info: {e}"}
 
     def close(self):
-        """Close InfluxDB client connection"""
+        """Stop the flusher, write buffered requests and close the client"""
+        self._batcher.close()
         if self._client:
             self._client.close()
 
 
 # Global instance
 influx_logger = InfluxDBLogger()
+# Write out any buffered requests when the process exits
+atexit.register(influx_logger.close)
 
 
 # Compatibility layer for existing code
@@ -593,6 +900,10 @@ class RequestLog:
     def cleanup_old_logs(cls, days: int = None) -> int:
         return influx_logger.cleanup_old_logs(days)
 
+    @classmethod
+    def set_retention_days(cls, days: int) -> bool:
+        return influx_logger.set_retention_days(days)
+
     # External-only methods for stats dashboard (filters out internal requests)
     @classmethod
     def get_external_requests_count(
@@ -4,7 +4,9 @@ import socket
 import ssl
 import time
 from datetime import datetime, timezone
+from functools import lru_cache
 
+import dns.flags
 import dns.resolver
 import dns.name
 import dns.rdatatype
@@ -13,37 +15,63 @@ from cryptography import x509
 from cryptography.hazmat.primitives import serialization
 
 
+# One resolver for all TLSA lookups: resolv.conf is read once and answers are
+# cached for their TTL. resolve() keeps no per-query state on the resolver and
+# LRUCache is locked internally, so concurrent validations can share it
+@lru_cache(maxsize=None)
+def _shared_resolver():
+    """Return the shared TLSA resolver, creating it on first use
+
+    Built lazily so a missing resolv.conf fails the lookup that needs it
+    rather than the import of this module; failures are not cached. Two
+    threads racing the first call may each build one, which is harmless.
+    """
+    resolver = dns.resolver.Resolver()
+    resolver.use_edns(0, dns.flags.DO)  # Enable DNSSEC
+    resolver.cache = dns.resolver.LRUCache(max_size=10000)
+    return resolver
+
+
+def _association_matches(computed_data, expected):
+    """Compare computed certificate association data with a TLSA record's
+
+    hex() and hexdigest() are already lowercase, so only the published data
+    needs normalizing.
+    """
+    return computed_data == expected.lower()
+
+
 class TLSAValidator:
     """
     TLSA (Transport Layer Security Authentication) record validator
     implementing DANE (DNS-Based Authentication of Named Entities) checking.
     """
 
+    # TLSA record certificate usage types
+    cert_usage_types = {
+        0: "PKIX-TA",  # CA constraint
+        1: "PKIX-EE",  # Service certificate constraint
+        2: "DANE-TA",  # Trust anchor assertion
+        3: "DANE-EE",  # Domain-issued certificate
+    }
+
+    # TLSA record selector types
+    selector_types = {
+        0: "Cert",  # Full certificate
+        1: "SPKI",  # Subject Public Key Info
+    }
+
+    # TLSA record matching types
+    matching_types = {
+        0: "Full",  # No hash, full data
+        1: "SHA-256",  # SHA-256 hash
+        2: "SHA-512",  # SHA-512 hash
+    }
+
     def __init__(self, domain):
         self.domain = domain
         self.domain_name = dns.name.from_text(domain)
 
-        # TLSA record certificate usage types
-        self.cert_usage_types = {
-            0: "PKIX-TA",  # CA constraint
-            1: "PKIX-EE",  # Service certificate constraint
-            2: "DANE-TA",  # Trust anchor assertion
-            3: "DANE-EE",  # Domain-issued certificate
-        }
-
-        # TLSA record selector types
-        self.selector_types = {
-            0: "Cert",  # Full certificate
-            1: "SPKI",  # Subject Public Key Info
-        }
-
-        # TLSA record matching types
-        self.matching_types = {
-            0: "Full",  # No hash, full data
-            1: "SHA-256",  # SHA-256 hash
-            2: "SHA-512",  # SHA-512 hash
-        }
-
     def validate_tlsa(self, port=443, protocol="tcp", timeout=10):
         """
         Validate TLSA records for the domain.
@@ -126,10 +154,7 @@ class TLSAValidator:
             # Construct TLSA record name: _port._protocol.domain
             tlsa_name = f"_{port}._{protocol}.{self.domain}"
 
-            resolver = dns.resolver.Resolver()
-            resolver.use_edns(0, dns.flags.DO)  # Enable DNSSEC
-
-            answer = resolver.resolve(tlsa_name, "TLSA")
+            answer = _shared_resolver().resolve(tlsa_name, "TLSA")
 
             for rr in answer.rrset:
                 tlsa_record = {
@@ -245,9 +270,12 @@ class TLSAValidator:
             "summary": {},
         }
 
+        # Records sharing a (selector, mtype) pair hash the same certificate
+        # material, so compute each digest at most once per certificate
+        digests = {}
         for tlsa_record in tlsa_records:
             association_result = self._validate_single_association(
-                tlsa_record, cert_info
+                tlsa_record, cert_info, digests
             )
 
             if association_result["valid"]:
@@ -278,8 +306,12 @@ class TLSAValidator:
 
         return validation_result
 
-    def _validate_single_association(self, tlsa_record, cert_info):
-        """Validate a single TLSA record against the certificate"""
+    def _validate_single_association(self, tlsa_record, cert_info, digests=None):
+        """Validate a single TLSA record against the certificate
+
+        *digests* optionally memoizes computed data keyed by (selector, mtype)
+        across records validated against the same certificate.
+        """
         result = {
             "tlsa_record": tlsa_record,
             "valid": False,
@@ -304,7 +336,10 @@ class TLSAValidator:
                 return result
 
             # Apply matching type (hashing)
-            if tlsa_record["mtype"] == 0:  # Full data, no hashing
+            digest_key = (tlsa_record["selector"], tlsa_record["mtype"])
+            if digests is not None and digest_key in digests:
+                computed_data = digests[digest_key]
+            elif tlsa_record["mtype"] == 0:  # Full data, no hashing
                 computed_data = data_to_hash.hex()
             elif tlsa_record["mtype"] == 1:  # SHA-256
                 computed_data = hashlib.sha256(data_to_hash).hexdigest()
@@ -314,6 +349,9 @@ class TLSAValidator:
                 result["reason"] = f"Unsupported matching type: {tlsa_record['mtype']}"
                 return result
 
+            if digests is not None:
+                digests[digest_key] = computed_data
+
             result["computed_hash"] = computed_data
             result["match_details"]["hash_algorithm"] = self.matching_types.get(
                 tlsa_record["mtype"], "Unknown"
@@ -321,7 +359,7 @@ class TLSAValidator:
             result["match_details"]["data_length"] = len(data_to_hash)
 
             # Compare with TLSA record
-            if computed_data.lower() == tlsa_record["cert_assoc_data"].lower():
+            if _association_matches(computed_data, tlsa_record["cert_assoc_data"]):
                 result["valid"] = True
                 result["reason"] = "Certificate association matches TLSA record"
             else:
@@ -3,13 +3,44 @@ Pytest configuration and shared fixtures for DNSSEC Validator tests.
 """
 
 import os
-import sys
-from unittest.mock import MagicMock, Mock
-
+from types import SimpleNamespace
+
+# dnspython submodules the validator tests patch or raise from; loaded here so
+# every xdist worker imports them at startup rather than inside the first test
+import dns.dnssec  # noqa: F401
+import dns.name  # noqa: F401
+import dns.rdatatype  # noqa: F401
+import dns.resolver  # noqa: F401
 import pytest
 
-# Add app directory to Python path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "app"))
+_HEALTH_OK = SimpleNamespace(status="pass", message="OK")
+
+
+class _FakeInflux:
+    """Lightweight stand-in for ``InfluxDBClient`` with no-op write/query APIs."""
+
+    __slots__ = ("_write", "_query")
+
+    def __init__(self):
+        self._write = SimpleNamespace(
+            write=lambda *args, **kwargs: None, close=lambda: None
+        )
+        self._query = SimpleNamespace(
+            query=lambda *args, **kwargs: [],
+            query_stream=lambda *args, **kwargs: iter(()),
+        )
+
+    def health(self):
+        return _HEALTH_OK
+
+    def write_api(self, *args, **kwargs):
+        return self._write
+
+    def query_api(self, *args, **kwargs):
+        return self._query
+
+    def close(self):
+        pass
 
 
 @pytest.fixture(scope="session")
@@ -21,18 +52,7 @@ def app_root():
 @pytest.fixture
 def mock_influxdb_client():
     """Mock InfluxDB client for testing."""
-    mock_client = MagicMock()
-    mock_client.health.return_value = Mock(status="pass", message="OK")
-
-    # Mock write API
-    mock_write_api = MagicMock()
-    mock_client.write_api.return_value = mock_write_api
-
-    # Mock query API
-    mock_query_api = MagicMock()
-    mock_client.query_api.return_value = mock_query_api
-
-    return mock_client
+    return _FakeInflux()
 
 
 @pytest.fixture
@@ -45,56 +65,137 @@ def mock_influxdb_logger(monkeypatch, mock_influxdb_client):
 
     # Mock the client property to return our mock
     monkeypatch.setattr(logger, "_client", mock_influxdb_client)
-    monkeypatch.setattr(
-        logger, "_write_api", mock_influxdb_client.write_api.return_value
-    )
-    monkeypatch.setattr(
-        logger, "_query_api", mock_influxdb_client.query_api.return_value
-    )
+    monkeypatch.setattr(logger, "_write_api", mock_influxdb_client.write_api())
+    monkeypatch.setattr(logger, "_query_api", mock_influxdb_client.query_api())
 
-    return logger
+    yield logger
+    # Stop the background flusher so it does not outlive the test
+    logger.close()
+
+
+# Environment exported for the Flask app under test
+TEST_CONFIG = {
+    "TESTING": True,
+    "DEBUG": True,
+    "RATELIMIT_ENABLED": False,
+    "RATELIMIT_STORAGE_URL": "memory://",
+    "SHOW_BONDIT_ATTRIBUTION": "true",
+    "INFLUX_URL": "http://test-influx:8086",
+    "INFLUX_TOKEN": "test-token",
+    "INFLUX_ORG": "test-org",
+    "INFLUX_BUCKET": "test-bucket",
+    "API_DOCS_ENABLED": "true",
+}
+
+# Undone in pytest_unconfigure
+_ENV_PATCH = pytest.MonkeyPatch()
+
+
+def pytest_configure(config):
+    """Export the test environment, then warm the module cache.
+
+    The app reads parts of its configuration at import time, so the
+    environment is set before anything (including test collection) imports
+    it; a developer's shell exports cannot leak into the app under test.
+    app/ and tests/fixtures/ are on sys.path via ``pythonpath`` in pytest.ini.
+    """
+    for key, value in TEST_CONFIG.items():
+        _ENV_PATCH.setenv(key, str(value))
+
+    import app  # noqa: F401
+    import cli  # noqa: F401
+    import domain_utils  # noqa: F401
+    import dnssec_validator  # noqa: F401
+
+
+def pytest_unconfigure(config):
+    """Restore the environment exported in pytest_configure."""
+    _ENV_PATCH.undo()
+
+
+@pytest.fixture(scope="session")
+def _session_config():
+    """Test configuration shared by the whole test session."""
+    return dict(TEST_CONFIG)
 
 
 @pytest.fixture
-def test_config():
+def test_config(_session_config):
     """Test configuration for Flask app."""
-    return {
-        "TESTING": True,
-        "DEBUG": True,
-        "RATELIMIT_ENABLED": False,
-        "RATELIMIT_STORAGE_URL": "memory://",
-        "SHOW_BONDIT_ATTRIBUTION": "true",
-        "INFLUX_URL": "http://test-influx:8086",
-        "INFLUX_TOKEN": "test-token",
-        "INFLUX_ORG": "test-org",
-        "INFLUX_BUCKET": "test-bucket",
-    }
+    return dict(_session_config)
+
+
+@pytest.fixture(scope="session")
+def flask_app(_session_config):
+    """Flask app instance shared by the whole test session."""
+    with pytest.MonkeyPatch.context() as mp:
+        # The environment was exported in pytest_configure
+        import app as flask_app_module
+
+        app_instance = flask_app_module.app
+        app_instance.config.update(_session_config)
+
+        # The limiter reads RATELIMIT_ENABLED only at init time, so toggle it
+        # directly; tests then see deterministic status codes instead of 429s
+        mp.setattr(
+            flask_app_module.limiter,
+            "enabled",
+            _session_config["RATELIMIT_ENABLED"],
+        )
+        # The bulk endpoint repeats the schema's checks in Python, so skip the
+        # JSON-schema pass; tests that cover it opt back in via schema_validation
+        mp.setattr(flask_app_module.api, "_validate", False)
+
+        yield app_instance
 
 
 @pytest.fixture
-def flask_app(test_config, monkeypatch):
-    """Create Flask app instance for testing."""
-    # Set environment variables for testing
-    for key, value in test_config.items():
-        monkeypatch.setenv(key, str(value))
-
-    # Mock InfluxDB client to prevent real connections
-    mock_client = MagicMock()
-    mock_client.health.return_value = Mock(status="pass", message="OK")
-    monkeypatch.setattr("models.InfluxDBClient", lambda **kwargs: mock_client)
+def schema_validation(flask_app, monkeypatch):
+    """Run Flask-RESTX payload validation as in production."""
+    import app as flask_app_module
+
+    monkeypatch.setattr(flask_app_module.api, "_validate", True)
 
-    # Import after setting env vars
+
+@pytest.fixture
+def rate_limiting(flask_app, monkeypatch):
+    """Enforce rate limits as in production, starting from empty counters."""
     import app as flask_app_module
 
-    app_instance = flask_app_module.app
-    app_instance.config.update(test_config)
+    limiter = flask_app_module.limiter
+    monkeypatch.setattr(limiter, "enabled", True)
+    limiter.reset()
+    yield
+    limiter.reset()
 
-    yield app_instance
 
+@pytest.fixture(autouse=True)
+def _isolate_app_config(request):
+    """Isolate each test that uses the shared Flask app.
+
+    Patches out the InfluxDB client and restores app.config afterwards.
+    """
+    if "flask_app" not in request.fixturenames:
+        yield
+        return
+
+    # Mock InfluxDB client to prevent real connections; patched per test so
+    # unit tests of models.py still see the real class
+    mock_client = _FakeInflux()
+    monkeypatch = request.getfixturevalue("monkeypatch")
+    monkeypatch.setattr("models.InfluxDBClient", lambda **kwargs: mock_client)
 
-@pytest.fixture
+    app_instance = request.getfixturevalue("flask_app")
+    saved = dict(app_instance.config)
+    app_instance.config.update(TESTING=True, RATELIMIT_ENABLED=False)
+    yield
+    app_instance.config.clear()
+    app_instance.config.update(saved)
+
+
+@pytest.fixture(scope="session")
 def client(flask_app):
-    """Create Flask test client."""
+    """Flask test client shared by the whole test session."""
     return flask_app.test_client()
 
 
@@ -102,11 +203,3 @@ def client(flask_app):
 def runner(flask_app):
     """Create Flask CLI test runner."""
     return flask_app.test_cli_runner()
-
-
-@pytest.fixture(autouse=True)
-def reset_env(monkeypatch):
-    """Reset environment variables before each test."""
-    # This runs automatically before each test
-    yield
-    # Cleanup happens automatically with monkeypatch
@@ -87,6 +87,7 @@ def _install_mock(page: Page, base_url: str, payload: dict) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_validation_flow_renders_chain_of_trust(page: Page, base_url: str) -> None:
     """Submitting a domain should render status, chain of trust and DNSKEYs."""
     domain = "bondit.dk"
@@ -106,6 +107,7 @@ def test_validation_flow_renders_chain_of_trust(page: Page, base_url: str) -> No
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_validation_flow_normalizes_url_input(page: Page, base_url: str) -> None:
     """The client must strip ``https://`` / ``www.`` before calling the API."""
     domain = "bondit.dk"
@@ -138,6 +140,7 @@ def test_validation_flow_normalizes_url_input(page: Page, base_url: str) -> None
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_validation_flow_displays_api_errors(page: Page, base_url: str) -> None:
     """A non-2xx API response must surface as a human-readable error."""
     page.route(
@@ -167,6 +170,7 @@ def test_validation_flow_displays_api_errors(page: Page, base_url: str) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_validation_flow_handles_network_failure(page: Page, base_url: str) -> None:
     """If the fetch itself fails the UI must display an error message."""
     page.route(
@@ -182,6 +186,7 @@ def test_validation_flow_handles_network_failure(page: Page, base_url: str) -> N
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_tlsa_dane_section_visibility_matches_feature_flag(
     page: Page, base_url: str, tlsa_dane_enabled: bool
 ) -> None:
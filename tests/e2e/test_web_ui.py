@@ -21,6 +21,7 @@ expect = playwright_sync_api.expect  # type: ignore[attr-defined]
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_index_page_renders_core_controls(page: Page, base_url: str) -> None:
     """The landing page must expose the domain input and submit button."""
     page.goto(f"{base_url}/")
@@ -44,6 +45,7 @@ def test_index_page_renders_core_controls(page: Page, base_url: str) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_navigation_links_present(page: Page, base_url: str) -> None:
     """Analytics and API Docs links must be wired up on the header."""
     page.goto(f"{base_url}/")
@@ -58,6 +60,7 @@ def test_navigation_links_present(page: Page, base_url: str) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_api_docs_page_loads_swagger_ui(page: Page, base_url: str) -> None:
     """The Swagger UI served by Flask-RESTX should render its container."""
     response = page.goto(f"{base_url}/api/docs/")
@@ -70,6 +73,7 @@ def test_api_docs_page_loads_swagger_ui(page: Page, base_url: str) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_health_endpoint_returns_ok(page: Page, base_url: str) -> None:
     """A quick HTTP-level sanity check via Playwright's request API."""
     response = page.request.get(f"{base_url}/health/simple")
@@ -77,6 +81,7 @@ def test_health_endpoint_returns_ok(page: Page, base_url: str) -> None:
 
 
 @pytest.mark.e2e
+@pytest.mark.slow
 def test_empty_submission_is_blocked_by_browser(page: Page, base_url: str) -> None:
     """Submitting an empty form must not trigger a network request.
 
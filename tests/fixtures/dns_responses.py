@@ -2,18 +2,52 @@
 Mock DNS response fixtures for DNSSEC validation testing.
 """
 
+import sys
+from functools import lru_cache
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import MagicMock
+
 import dns.name
+import dns.resolver
 import dns.rdatatype
 import dns.rdataclass
 import dns.rrset
 import dns.rdata
-from unittest.mock import MagicMock
 
+__all__ = [
+    "create_mock_dnskey_rrset",
+    "create_mock_ds_rrset",
+    "create_mock_rrsig_rrset",
+    "VALID_DNSSEC_CHAIN",
+    "UNSIGNED_DOMAIN",
+    "BROKEN_DNSSEC_CHAIN",
+    "BOGUS_DNSSEC",
+    "get_dns_response",
+    "make_resolver_side_effect",
+    "parse_name",
+]
+
+
+# Parsed names are immutable, so each one is parsed once and shared with
+# the other fixture modules and tests
+parse_name = lru_cache(maxsize=256)(dns.name.from_text)
 
+
+def _frozen(responses):
+    """Return a read-only view of ``responses`` keyed by interned domain names."""
+    return MappingProxyType(
+        {sys.intern(k): MappingProxyType(v) for k, v in responses.items()}
+    )
+
+
+@lru_cache(maxsize=64)
 def create_mock_dnskey_rrset(domain, flags=257, algorithm=8, key_data="test_key"):
-    """Create a mock DNSKEY RRset."""
+    """Create a mock DNSKEY RRset.
+
+    Results are cached per argument set; callers must treat them as read-only.
+    """
     rrset = MagicMock()
-    rrset.name = dns.name.from_text(domain)
+    rrset.name = parse_name(domain)
     rrset.rdtype = dns.rdatatype.DNSKEY
     rrset.rdclass = dns.rdataclass.IN
     rrset.ttl = 3600
@@ -31,10 +65,11 @@ def create_mock_dnskey_rrset(domain, flags=257, algorithm=8, key_data="test_key"
     return rrset
 
 
+@lru_cache(maxsize=64)
 def create_mock_ds_rrset(domain, key_tag=12345, algorithm=8, digest_type=2):
-    """Create a mock DS RRset."""
+    """Create a mock DS RRset (cached like ``create_mock_dnskey_rrset``)."""
     rrset = MagicMock()
-    rrset.name = dns.name.from_text(domain)
+    rrset.name = parse_name(domain)
     rrset.rdtype = dns.rdatatype.DS
     rrset.rdclass = dns.rdataclass.IN
     rrset.ttl = 3600
@@ -71,7 +106,7 @@ def create_mock_rrsig_rrset(
         inception: Signature inception timestamp (default: 0)
     """
     rrset = MagicMock()
-    rrset.name = dns.name.from_text(domain)
+    rrset.name = parse_name(domain)
     rrset.rdtype = dns.rdatatype.RRSIG
     rrset.rdclass = dns.rdataclass.IN
     rrset.ttl = 3600
@@ -85,7 +120,7 @@ def create_mock_rrsig_rrset(
     rrsig.expiration = expiration
     rrsig.inception = inception
     rrsig.key_tag = key_tag
-    rrsig.signer = dns.name.from_text(domain)
+    rrsig.signer = parse_name(domain)
     rrsig.signature = b"test_signature"
 
     rrset.__iter__ = lambda self: iter([rrsig])
@@ -95,56 +130,68 @@ def create_mock_rrsig_rrset(
 
 
 # Valid DNSSEC chain responses
-VALID_DNSSEC_CHAIN = {
-    "bondit.dk": {
-        "dnskey": create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13),
-        "ds": create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13),
-        "rrsig": create_mock_rrsig_rrset("bondit.dk", algorithm=13, key_tag=12345),
-        "status": "valid",
-    },
-    "cloudflare.com": {
-        "dnskey": create_mock_dnskey_rrset("cloudflare.com", flags=257, algorithm=13),
-        "ds": create_mock_ds_rrset("cloudflare.com", key_tag=2371, algorithm=13),
-        "rrsig": create_mock_rrsig_rrset("cloudflare.com", algorithm=13, key_tag=2371),
-        "status": "valid",
-    },
-}
+VALID_DNSSEC_CHAIN = _frozen(
+    {
+        "bondit.dk": {
+            "dnskey": create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13),
+            "ds": create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13),
+            "rrsig": create_mock_rrsig_rrset("bondit.dk", algorithm=13, key_tag=12345),
+            "status": "valid",
+        },
+        "cloudflare.com": {
+            "dnskey": create_mock_dnskey_rrset(
+                "cloudflare.com", flags=257, algorithm=13
+            ),
+            "ds": create_mock_ds_rrset("cloudflare.com", key_tag=2371, algorithm=13),
+            "rrsig": create_mock_rrsig_rrset(
+                "cloudflare.com", algorithm=13, key_tag=2371
+            ),
+            "status": "valid",
+        },
+    }
+)
 
 # Unsigned domain (no DNSSEC)
-UNSIGNED_DOMAIN = {
-    "example.org": {
-        "dnskey": None,
-        "ds": None,
-        "rrsig": None,
-        "status": "insecure",
+UNSIGNED_DOMAIN = _frozen(
+    {
+        "example.org": {
+            "dnskey": None,
+            "ds": None,
+            "rrsig": None,
+            "status": "insecure",
+        }
     }
-}
+)
 
 # Broken DNSSEC chain
-BROKEN_DNSSEC_CHAIN = {
-    "broken-dnssec.example": {
-        "dnskey": create_mock_dnskey_rrset(
-            "broken-dnssec.example", flags=257, algorithm=8
-        ),
-        "ds": None,  # Missing DS record breaks the chain
-        "rrsig": create_mock_rrsig_rrset(
-            "broken-dnssec.example", algorithm=8, key_tag=99999
-        ),
-        "status": "invalid",
+BROKEN_DNSSEC_CHAIN = _frozen(
+    {
+        "broken-dnssec.example": {
+            "dnskey": create_mock_dnskey_rrset(
+                "broken-dnssec.example", flags=257, algorithm=8
+            ),
+            "ds": None,  # Missing DS record breaks the chain
+            "rrsig": create_mock_rrsig_rrset(
+                "broken-dnssec.example", algorithm=8, key_tag=99999
+            ),
+            "status": "invalid",
+        }
     }
-}
+)
 
 # Bogus DNSSEC (signature verification fails)
-BOGUS_DNSSEC = {
-    "bogus.example": {
-        "dnskey": create_mock_dnskey_rrset("bogus.example", flags=257, algorithm=8),
-        "ds": create_mock_ds_rrset("bogus.example", key_tag=11111, algorithm=8),
-        "rrsig": create_mock_rrsig_rrset(
-            "bogus.example", algorithm=8, key_tag=22222
-        ),  # Mismatched key tag
-        "status": "bogus",
+BOGUS_DNSSEC = _frozen(
+    {
+        "bogus.example": {
+            "dnskey": create_mock_dnskey_rrset("bogus.example", flags=257, algorithm=8),
+            "ds": create_mock_ds_rrset("bogus.example", key_tag=11111, algorithm=8),
+            "rrsig": create_mock_rrsig_rrset(
+                "bogus.example", algorithm=8, key_tag=22222
+            ),  # Mismatched key tag
+            "status": "bogus",
+        }
     }
-}
+)
 
 
 def get_dns_response(domain, status="valid"):
@@ -170,3 +217,27 @@ def get_dns_response(domain, status="valid"):
         return BOGUS_DNSSEC.get(domain, BOGUS_DNSSEC["bogus.example"])
     else:
         return None
+
+
+def make_resolver_side_effect(dnskey_rrset=None, ds_rrset=None, rrsig_rrset=None):
+    """Build a ``resolver.resolve`` side effect serving fixed rrsets by type.
+
+    Record types without an rrset raise ``dns.resolver.NoAnswer``.
+    """
+    answers = {
+        record_type: SimpleNamespace(rrset=rrset)
+        for record_type, rrset in (
+            ("DNSKEY", dnskey_rrset),
+            ("DS", ds_rrset),
+            ("RRSIG", rrsig_rrset),
+        )
+        if rrset is not None
+    }
+
+    def resolve(zone, record_type):
+        try:
+            return answers[record_type]
+        except KeyError:
+            raise dns.resolver.NoAnswer() from None
+
+    return resolve
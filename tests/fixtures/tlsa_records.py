@@ -4,8 +4,11 @@ Mock TLSA record fixtures for DANE validation testing.
 
 from unittest.mock import MagicMock
 import dns.name
+import dns.rdataclass
 import dns.rdatatype
 
+from dns_responses import parse_name
+
 
 def create_mock_tlsa_record(usage=3, selector=1, mtype=1, cert_data=None):
     """
@@ -50,7 +53,7 @@ def create_mock_tlsa_rrset(domain, port=443, protocol="tcp", records=None):
         records = [create_mock_tlsa_record()]
 
     rrset = MagicMock()
-    rrset.name = dns.name.from_text(f"_{port}._{protocol}.{domain}")
+    rrset.name = parse_name(f"_{port}._{protocol}.{domain}")
     rrset.rdtype = dns.rdatatype.TLSA
     rrset.rdclass = dns.rdataclass.IN
     rrset.ttl = 3600
@@ -0,0 +1,22 @@
+"""
+Canned DNSSECValidator.validate() results for endpoint testing.
+"""
+
+from types import MappingProxyType
+
+# Read-only; tests hand out dict() copies since the app annotates results
+# in place
+VALID_TEST_DK = MappingProxyType(
+    {"domain": "test.dk", "status": "valid", "has_dnssec": True}
+)
+VALID_EXAMPLE = MappingProxyType(
+    {"domain": "example.com", "status": "valid", "has_dnssec": True}
+)
+INVALID_BROKEN = MappingProxyType(
+    {
+        "domain": "broken.example",
+        "status": "invalid",
+        "has_dnssec": True,
+        "errors": ["Signature verification failed"],
+    }
+)
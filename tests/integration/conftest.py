@@ -0,0 +1,26 @@
+"""
+Shared configuration for integration tests
+"""
+
+from unittest.mock import Mock
+
+import pytest
+
+
+@pytest.fixture(scope="package")
+def _validate_mock():
+    """Install one Mock over DNSSECValidator.validate for the package."""
+    import dnssec_validator
+
+    # Spec'd against the real method so misspelled attributes fail loudly
+    mock = Mock(spec=dnssec_validator.DNSSECValidator.validate)
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(dnssec_validator.DNSSECValidator, "validate", mock)
+        yield mock
+
+
+@pytest.fixture
+def mock_validate(_validate_mock):
+    """Shared validate mock with calls, return value and side effect reset."""
+    _validate_mock.reset_mock(return_value=True, side_effect=True)
+    return _validate_mock
@@ -9,9 +9,15 @@ Tests the complete request/response cycle including:
 - Rate limiting
 """
 
-import json
 import pytest
-from unittest.mock import patch, MagicMock
+
+from validation_results import VALID_TEST_DK, INVALID_BROKEN
+
+# Known, harmless warnings raised on every request through the Flask app
+pytestmark = [
+    pytest.mark.filterwarnings("ignore:datetime.datetime.utcnow:DeprecationWarning"),
+    pytest.mark.filterwarnings("ignore:Using the in-memory storage:UserWarning"),
+]
 
 
 class TestHealthEndpoint:
@@ -21,14 +27,14 @@ class TestHealthEndpoint:
         """Test health endpoint returns success"""
         response = client.get("/health")
         assert response.status_code in [200, 503]
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["status"] in ["healthy", "degraded", "unhealthy"]
         assert "timestamp" in data
 
     def test_health_check_has_checks(self, client):
         """Test health check includes system checks"""
         response = client.get("/health")
-        data = json.loads(response.data)
+        data = response.get_json()
         # Health check includes checks dict
         if response.status_code == 200:
             assert "checks" in data or "status" in data
@@ -45,20 +51,30 @@ class TestWebInterface:
 
     def test_index_has_form(self, client):
         """Test index page contains validation form"""
-        response = client.get("/")
-        assert b"<form" in response.data
-        assert b"domain" in response.data
+        body = client.get("/").data
+        assert b"<form" in body
+        assert b"domain" in body
 
     def test_api_docs_available(self, client):
         """Test API documentation is accessible"""
         response = client.get("/api/docs/")
         assert response.status_code == 200
 
+    @pytest.mark.parametrize(
+        "env,expected",
+        [({}, True), ({"API_DOCS_ENABLED": "false"}, False)],
+        ids=["default", "disabled"],
+    )
+    def test_api_docs_enabled_flag(self, env, expected):
+        """Test the API_DOCS_ENABLED flag parsing"""
+        from app import api_docs_enabled
+
+        assert api_docs_enabled(env) is expected
+
 
 class TestValidationAPI:
     """Test DNSSEC validation API endpoints"""
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_validate_domain_valid(self, mock_validate, client):
         """Test API validation for valid domain"""
         mock_validate.return_value = {
@@ -70,23 +86,17 @@ class TestValidationAPI:
 
         response = client.get("/api/validate/bondit.dk")
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["domain"] == "bondit.dk"
         assert data["status"] == "valid"
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_validate_domain_invalid(self, mock_validate, client):
         """Test API validation for invalid DNSSEC"""
-        mock_validate.return_value = {
-            "domain": "broken.example",
-            "status": "invalid",
-            "has_dnssec": True,
-            "errors": ["Signature verification failed"],
-        }
+        mock_validate.return_value = dict(INVALID_BROKEN)
 
         response = client.get("/api/validate/broken.example")
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data["status"] == "invalid"
         assert "errors" in data
 
@@ -95,7 +105,6 @@ class TestValidationAPI:
         response = client.get("/api/validate/")
         assert response.status_code in [400, 404, 308]  # 308 = redirect
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_validate_invalid_domain_format(self, mock_validate, client):
         """Test validation with invalid domain format"""
         # Mock to return error for invalid domain
@@ -104,14 +113,9 @@ class TestValidationAPI:
         response = client.get("/api/validate/invalid..domain")
         assert response.status_code in [400, 500]
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_validate_logs_to_influx(self, mock_validate, client):
         """Test validation logs to InfluxDB"""
-        mock_validate.return_value = {
-            "domain": "test.dk",
-            "status": "valid",
-            "has_dnssec": True,
-        }
+        mock_validate.return_value = dict(VALID_TEST_DK)
 
         response = client.get("/api/validate/test.dk")
         # Just check response is successful
@@ -124,10 +128,9 @@ class TestValidationAPI:
 class TestCORSHeaders:
     """Test CORS header configuration"""
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_cors_headers_present(self, mock_validate, client):
         """Test CORS headers are set on API responses"""
-        mock_validate.return_value = {"domain": "test.dk", "status": "valid"}
+        mock_validate.return_value = dict(VALID_TEST_DK)
         response = client.get("/api/validate/bondit.dk")
         # CORS headers may or may not be present depending on config
         assert response.status_code in [200, 500]
@@ -141,7 +144,6 @@ class TestErrorHandling:
         response = client.get("/api/nonexistent")
         assert response.status_code == 404
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
     def test_500_on_validation_exception(self, mock_validate, client):
         """Test 500 error when validation raises exception"""
         mock_validate.side_effect = Exception("DNS query failed")
@@ -149,21 +151,15 @@ class TestErrorHandling:
         response = client.get("/api/validate/test.dk")
         assert response.status_code == 500
 
-    @patch("dnssec_validator.DNSSECValidator.validate")
-    def test_rate_limiting(self, mock_validate, client):
+    def test_rate_limiting(self, mock_validate, client, rate_limiting):
         """Test rate limiting is applied"""
-        mock_validate.return_value = {"domain": "test.dk", "status": "valid"}
-
-        # Make multiple rapid requests
-        hit_rate_limit = False
-        for _ in range(15):  # Exceed typical rate limit (10/min)
-            response = client.get("/api/validate/test.dk")
-            if response.status_code == 429:
-                hit_rate_limit = True
-                break
-
-        # Rate limiting should trigger
-        assert hit_rate_limit or response.status_code == 200
+        mock_validate.return_value = dict(VALID_TEST_DK)
+
+        # The validation API allows 10 requests per minute
+        statuses = [client.get("/api/validate/test.dk").status_code for _ in range(11)]
+
+        assert statuses[:10] == [200] * 10
+        assert statuses[10] == 429
 
 
 class TestStaticAssets:
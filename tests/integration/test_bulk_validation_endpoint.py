@@ -3,253 +3,278 @@ Integration tests for bulk DNSSEC validation API endpoint
 """
 
 import json
+
 import pytest
-from unittest.mock import patch, MagicMock
-from app import app
 
+# Known, harmless warnings raised on every request through the Flask app
+pytestmark = [
+    pytest.mark.filterwarnings("ignore:datetime.datetime.utcnow:DeprecationWarning"),
+    pytest.mark.filterwarnings("ignore:Using the in-memory storage:UserWarning"),
+]
 
-@pytest.fixture
-def client():
-    """Create a test client for the Flask application"""
-    app.config["TESTING"] = True
-    with app.test_client() as client:
-        yield client
+# More domains than the bulk endpoint accepts in one request
+_TOO_MANY_DOMAINS = tuple(f"example{i}.com" for i in range(51))
 
 
-class TestBulkValidationEndpoint:
-    """Integration tests for bulk validation endpoint"""
+def _encode(body):
+    """Serialize a request body to compact JSON bytes."""
+    return json.dumps(body, separators=(",", ":")).encode()
 
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_endpoint_basic(self, mock_validator, client):
-        """Test basic bulk validation with two domains"""
-        mock_validator.return_value.validate.return_value = {
-            "domain": "test.com",
-            "status": "valid",
-            "validation_time": "2026-01-25T12:00:00Z",
-            "chain_of_trust": [],
-            "records": {"dnskey": [], "ds": [], "rrsig": []},
-            "errors": [],
-        }
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": ["bondit.dk", "example.com"]}),
-            content_type="application/json",
-        )
 
-        # Should succeed or hit rate limit
-        assert response.status_code in [200, 429]
-
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            assert "results" in data
-            assert "summary" in data
-            assert len(data["results"]) == 2
-            assert data["summary"]["total"] == 2
-
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_with_sequential_option(self, mock_validator, client):
-        """Test bulk validation with sequential processing"""
-        mock_validator.return_value.validate.return_value = {
-            "domain": "test.com",
-            "status": "valid",
-            "validation_time": "2026-01-25T12:00:00Z",
-            "chain_of_trust": [],
-            "records": {"dnskey": [], "ds": [], "rrsig": []},
-            "errors": [],
-        }
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps(
-                {
-                    "domains": ["bondit.dk"],
-                    "options": {"parallel": False, "timeout": 30},
-                }
-            ),
-            content_type="application/json",
-        )
+# Request bodies reused across tests, encoded once
+_PAYLOAD_ONE = _encode({"domains": ["bondit.dk"]})
+_PAYLOAD_TWO = _encode({"domains": ["bondit.dk", "example.com"]})
 
-        assert response.status_code in [200, 429]
 
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            assert "results" in data
-            assert "summary" in data
+def _post_bulk(client, payload):
+    """POST pre-encoded JSON bytes to the bulk endpoint."""
+    return client.post(
+        "/api/validate/bulk", data=payload, content_type="application/json"
+    )
 
-    def test_bulk_validation_empty_domains(self, client):
-        """Test bulk validation with empty domain list"""
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": []}),
-            content_type="application/json",
-        )
 
-        # Should return 400 bad request (or 429 if rate limited)
-        assert response.status_code in [400, 429]
+# validation_time is omitted: the endpoint stamps each result itself
+_VALID_RESULT = {
+    "domain": "test.com",
+    "status": "valid",
+    "chain_of_trust": [],
+    "records": {"dnskey": [], "ds": [], "rrsig": []},
+    "errors": [],
+}
 
-    def test_bulk_validation_too_many_domains(self, client):
-        """Test bulk validation with too many domains"""
-        domains = [f"example{i}.com" for i in range(51)]
 
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": domains}),
-            content_type="application/json",
-        )
+class _StubValidator:
+    """Lightweight DNSSECValidator stand-in returning a valid result"""
 
-        # Should return 400 bad request (or 429 if rate limited)
-        assert response.status_code in [400, 429]
+    def __init__(self, domain, *args, **kwargs):
+        self.domain = domain
 
-    def test_bulk_validation_invalid_json(self, client):
-        """Test bulk validation with invalid JSON"""
-        response = client.post(
-            "/api/validate/bulk",
-            data="not valid json",
-            content_type="application/json",
-        )
+    def validate(self):
+        # The endpoint annotates results in place, so hand out a copy
+        return dict(_VALID_RESULT)
 
-        assert response.status_code in [400, 429]
 
-    def test_bulk_validation_missing_domains_field(self, client):
-        """Test bulk validation without domains field"""
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"options": {"timeout": 30}}),
-            content_type="application/json",
-        )
+def _side_effect_validator(outcomes):
+    """Build a stub validator class that yields *outcomes* in call order"""
+    outcomes = list(outcomes)
 
-        assert response.status_code in [400, 429]
+    class _SideEffectValidator(_StubValidator):
+        def validate(self):
+            outcome = outcomes.pop(0)
+            if isinstance(outcome, Exception):
+                raise outcome
+            return dict(outcome)
 
-    def test_bulk_validation_invalid_timeout(self, client):
-        """Test bulk validation with invalid timeout value"""
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": ["bondit.dk"], "options": {"timeout": 200}}),
-            content_type="application/json",
-        )
+    return _SideEffectValidator
 
-        # Should reject invalid timeout (or hit rate limit)
-        assert response.status_code in [400, 429]
 
-    def test_bulk_validation_get_method_not_allowed(self, client):
-        """Test that GET method is not allowed on bulk endpoint"""
-        response = client.get("/api/validate/bulk")
+@pytest.fixture(scope="module", autouse=True)
+def stub_validator():
+    """Install the stub validator where the bulk endpoint looks it up"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("app.DNSSECValidator", _StubValidator)
+        yield
 
-        # Should return 400/405 Method Not Allowed (or 429 if rate limited)
-        assert response.status_code in [400, 405, 429]
 
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_url_extraction(self, mock_validator, client):
-        """Test bulk validation with URL input"""
-        mock_validator.return_value.validate.return_value = {
-            "domain": "bondit.dk",
-            "status": "valid",
-            "validation_time": "2026-01-25T12:00:00Z",
-            "chain_of_trust": [],
-            "records": {"dnskey": [], "ds": [], "rrsig": []},
-            "errors": [],
-        }
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps(
-                {"domains": ["https://bondit.dk", "http://bondit.dk/path"]}
+@pytest.fixture
+def status_validator(request, monkeypatch):
+    """Install a validator reporting the statuses in *request.param*"""
+    statuses = request.param
+    monkeypatch.setattr(
+        "app.DNSSECValidator",
+        _side_effect_validator(
+            {"domain": "test.com", "status": status} for status in statuses
+        ),
+    )
+    return statuses
+
+
+class TestBulkValidationEndpoint:
+    """Integration tests for bulk validation endpoint"""
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            _PAYLOAD_TWO,
+            _encode(
+                {
+                    "domains": ["bondit.dk", "example.com"],
+                    "options": {"parallel": False, "timeout": 30},
+                }
+            ),
+        ],
+        ids=["parallel", "sequential"],
+    )
+    def test_bulk_validation_endpoint_basic(self, client, payload):
+        """Test basic bulk validation with two domains in either mode"""
+        response = _post_bulk(client, payload)
+
+        assert response.status_code == 200
+
+        data = response.get_json()
+        assert "results" in data
+        assert "summary" in data
+        assert len(data["results"]) == 2
+        assert data["summary"]["total"] == 2
+        assert data["summary"]["valid"] == 2
+        # Every result carries an ISO 8601 timestamp
+        for result in data["results"]:
+            assert isinstance(result["validation_time"], str)
+
+    @pytest.mark.parametrize(
+        "method,payload,expected",
+        [
+            ("post", _encode({"domains": []}), 400),
+            ("post", _encode({"domains": _TOO_MANY_DOMAINS}), 400),
+            ("post", b"not valid json", 400),
+            ("post", b" ", 400),
+            ("post", _encode({"domains": "bondit.dk"}), 400),
+            ("post", _encode({"options": {"timeout": 30}}), 400),
+            (
+                "post",
+                _encode({"domains": ["bondit.dk"], "options": {"timeout": 200}}),
+                400,
             ),
-            content_type="application/json",
+            # GET falls through to /api/validate/<domain> with "bulk" as the domain
+            ("get", None, 400),
+        ],
+        ids=[
+            "empty_domains",
+            "too_many_domains",
+            "invalid_json",
+            "empty_body",
+            "domains_not_a_list",
+            "missing_domains_field",
+            "invalid_timeout",
+            "get_method_not_allowed",
+        ],
+    )
+    def test_bulk_validation_rejected_request(self, client, method, payload, expected):
+        """Test that malformed bulk requests are rejected"""
+        if method == "get":
+            response = client.get("/api/validate/bulk")
+        else:
+            response = _post_bulk(client, payload)
+
+        assert response.status_code == expected
+
+    def test_bulk_endpoint_exists(self, client):
+        """Test that the bulk endpoint is routed for POST"""
+        urls = client.application.url_map.bind("localhost")
+        endpoint, _ = urls.match("/api/validate/bulk", method="POST")
+
+        assert endpoint
+
+    def test_bulk_validation_url_extraction(self, client):
+        """Test bulk validation with URL input"""
+        response = _post_bulk(
+            client, _encode({"domains": ["https://bondit.dk", "http://bondit.dk/path"]})
         )
 
-        assert response.status_code in [200, 429]
+        assert response.status_code == 200
 
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            # Should extract domains from URLs
-            assert len(data["results"]) == 2
+        data = response.get_json()
+        # Should extract domains from URLs
+        assert len(data["results"]) == 2
 
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_mixed_valid_invalid(self, mock_validator, client):
+    def test_bulk_validation_mixed_valid_invalid(self, client):
         """Test bulk validation with mix of valid and invalid domains"""
-        mock_validator.return_value.validate.return_value = {
-            "domain": "bondit.dk",
-            "status": "valid",
-            "validation_time": "2026-01-25T12:00:00Z",
-            "chain_of_trust": [],
-            "records": {"dnskey": [], "ds": [], "rrsig": []},
-            "errors": [],
-        }
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps(
-                {"domains": ["bondit.dk", "invalid..domain", "example.com"]}
-            ),
-            content_type="application/json",
+        response = _post_bulk(
+            client,
+            _encode({"domains": ["bondit.dk", "invalid..domain", "example.com"]}),
         )
 
-        assert response.status_code in [200, 400, 429]
+        assert response.status_code == 200
 
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_error_handling(self, mock_validator, client):
+    def test_bulk_validation_error_handling(self, monkeypatch, client):
         """Test bulk validation handles individual domain errors"""
         # Make validator raise exception for some domains
-        mock_validator.return_value.validate.side_effect = [
-            {
-                "domain": "bondit.dk",
-                "status": "valid",
-                "validation_time": "2026-01-25T12:00:00Z",
-            },
-            Exception("DNS timeout"),
-        ]
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": ["bondit.dk", "example.com"]}),
-            content_type="application/json",
+        monkeypatch.setattr(
+            "app.DNSSECValidator",
+            _side_effect_validator(
+                [
+                    {
+                        "domain": "bondit.dk",
+                        "status": "valid",
+                    },
+                    Exception("DNS timeout"),
+                ]
+            ),
         )
 
-        assert response.status_code in [200, 429]
+        response = _post_bulk(client, _PAYLOAD_TWO)
 
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            # Should have results for both domains despite error
-            assert len(data["results"]) == 2
+        assert response.status_code == 200
 
-    @patch("dnssec_validator.DNSSECValidator")
-    def test_bulk_validation_summary_structure(self, mock_validator, client):
-        """Test that bulk validation returns correct summary structure"""
-        mock_validator.return_value.validate.return_value = {
-            "domain": "test.com",
-            "status": "valid",
-            "validation_time": "2026-01-25T12:00:00Z",
-            "chain_of_trust": [],
-            "records": {"dnskey": [], "ds": [], "rrsig": []},
-            "errors": [],
-        }
-
-        response = client.post(
-            "/api/validate/bulk",
-            data=json.dumps({"domains": ["bondit.dk"]}),
-            content_type="application/json",
-        )
+        data = response.get_json()
+        # Should have results for both domains despite error
+        assert len(data["results"]) == 2
+        assert data["summary"]["error"] == 1
 
-        assert response.status_code in [200, 429]
-
-        if response.status_code == 200:
-            data = json.loads(response.data)
-            summary = data["summary"]
-
-            # Check summary has all required fields
-            assert "total" in summary
-            assert "valid" in summary
-            assert "invalid" in summary
-            assert "insecure" in summary
-            assert "error" in summary
-            assert "processing_time" in summary
-
-            # Check types
-            assert isinstance(summary["total"], int)
-            assert isinstance(summary["valid"], int)
-            assert isinstance(summary["invalid"], int)
-            assert isinstance(summary["insecure"], int)
-            assert isinstance(summary["error"], int)
-            assert isinstance(summary["processing_time"], (int, float))
+    def test_bulk_validation_summary_structure(self, client):
+        """Test that bulk validation returns correct summary structure"""
+        response = _post_bulk(client, _PAYLOAD_ONE)
+
+        assert response.status_code == 200
+
+        data = response.get_json()
+        summary = data["summary"]
+
+        # Check summary has all required fields
+        assert "total" in summary
+        assert "valid" in summary
+        assert "invalid" in summary
+        assert "insecure" in summary
+        assert "error" in summary
+        assert "processing_time" in summary
+
+        # Check types
+        assert isinstance(summary["total"], int)
+        assert isinstance(summary["valid"], int)
+        assert isinstance(summary["invalid"], int)
+        assert isinstance(summary["insecure"], int)
+        assert isinstance(summary["error"], int)
+        assert isinstance(summary["processing_time"], (int, float))
+
+    @pytest.mark.parametrize(
+        "status_validator,expected",
+        [
+            (
+                ["valid", "valid", "invalid", "insecure"],
+                {"valid": 2, "invalid": 1, "insecure": 1, "error": 0},
+            ),
+            (
+                ["valid", "invalid", "insecure", "error"],
+                {"valid": 1, "invalid": 1, "insecure": 1, "error": 1},
+            ),
+        ],
+        ids=["mixed_statuses", "all_status_types"],
+        indirect=["status_validator"],
+    )
+    def test_bulk_validation_summary_counts(self, client, status_validator, expected):
+        """Test that the summary counts each result status"""
+        domains = [f"domain{i}.dk" for i in range(len(status_validator))]
+        response = _post_bulk(client, _encode({"domains": domains}))
+
+        assert response.status_code == 200
+
+        summary = response.get_json()["summary"]
+        assert summary["total"] == len(status_validator)
+        for status, count in expected.items():
+            assert summary[status] == count
+
+    @pytest.mark.parametrize(
+        "payload",
+        [
+            _encode({"domains": "bondit.dk"}),
+            _encode({"options": {"timeout": 30}}),
+            _encode({"domains": ["bondit.dk"], "options": {"timeout": 200}}),
+        ],
+        ids=["domains_not_a_list", "missing_domains_field", "invalid_timeout"],
+    )
+    def test_bulk_validation_schema_rejects(self, client, schema_validation, payload):
+        """Test that the request model itself rejects malformed payloads"""
+        response = _post_bulk(client, payload)
+
+        assert response.status_code == 400
+        assert response.get_json()["message"] == "Input payload validation failed"
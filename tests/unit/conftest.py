@@ -0,0 +1,50 @@
+"""
+Shared fixtures for unit tests
+"""
+
+from unittest.mock import Mock, patch
+
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Click runner shared by all CLI tests; each invoke isolates its own stdio."""
+    return CliRunner()
+
+
+@pytest.fixture
+def mock_request_log(monkeypatch):
+    """Patch ``cli.RequestLog`` with a fresh spec'd Mock."""
+    import cli
+    from models import RequestLog
+
+    mock = Mock(spec=RequestLog)
+    monkeypatch.setattr(cli, "RequestLog", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_logger(monkeypatch):
+    """Patch ``cli.influx_logger`` with a fresh spec'd Mock."""
+    import cli
+    from models import InfluxDBLogger
+
+    mock = Mock(spec=InfluxDBLogger)
+    monkeypatch.setattr(cli, "influx_logger", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_resolver():
+    """Resolver instance returned by a patched ``dns.resolver.Resolver``."""
+    with patch("dns.resolver.Resolver") as resolver_class:
+        yield resolver_class.return_value
+
+
+@pytest.fixture
+def mock_key_id():
+    """Patched ``dns.dnssec.key_id`` returning key tag 12345 by default."""
+    with patch("dns.dnssec.key_id", return_value=12345) as key_id:
+        yield key_id
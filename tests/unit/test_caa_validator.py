@@ -3,16 +3,11 @@ Unit tests for CAAValidator class.
 Tests CAA (RFC 8659) validation logic with mocked DNS responses.
 """
 
-import os
-import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "app"))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "fixtures"))
-
-from caa_validator import (  # noqa: E402  pylint: disable=wrong-import-position
+from caa_validator import (
     CAAValidator,
     KNOWN_CAA_TAGS,
     ISSUANCE_TAGS,
@@ -4,12 +4,18 @@ Tests command-line interface with InfluxDB.
 """
 
 import pytest
-from click.testing import CliRunner
-from unittest.mock import patch, MagicMock
-import sys
-import os
+from unittest.mock import MagicMock
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "app"))
+# Canned RequestLog data for the stats commands; the CLI only reads it
+_STATS_COUNTS = (100, 500, 800, 1000)
+_TOP_DOMAINS = (("bondit.dk", 50), ("example.com", 30))
+_VALIDATION_RATIO = {
+    "total": 1000,
+    "valid": {"count": 800, "percentage": 80.0},
+    "invalid": {"count": 150, "percentage": 15.0},
+    "error": {"count": 50, "percentage": 5.0},
+}
+_HOURLY_REQUESTS = (("2024-01-01 12:00", 50), ("2024-01-01 13:00", 50))
 
 
 @pytest.mark.unit
@@ -22,8 +28,7 @@ class TestCLICommands:
 
         assert callable(cli)
 
-    @patch("cli.influx_logger")
-    def test_init_db_success(self, mock_logger):
+    def test_init_db_success(self, mock_logger, cli_runner):
         """Test init_db command success."""
         from cli import init_db
 
@@ -33,141 +38,146 @@ class TestCLICommands:
             "bucket_id": "123",
         }
 
-        runner = CliRunner()
-        result = runner.invoke(init_db)
+        result = cli_runner.invoke(init_db)
 
         assert result.exit_code == 0
         assert "successful" in result.output.lower()
 
-    @patch("cli.influx_logger")
-    def test_init_db_no_client(self, mock_logger):
+    def test_init_db_no_client(self, mock_logger, cli_runner):
         """Test init_db when client connection fails."""
         from cli import init_db
 
         mock_logger.client = None
 
-        runner = CliRunner()
-        result = runner.invoke(init_db)
+        result = cli_runner.invoke(init_db)
 
         assert result.exit_code == 1
         assert "error" in result.output.lower()
 
-    @patch("cli.RequestLog")
-    def test_cleanup_logs_dry_run(self, mock_request_log):
+    def test_cleanup_logs_dry_run(self, mock_request_log, cli_runner):
         """Test cleanup_logs with dry-run flag."""
         from cli import cleanup_logs
 
-        runner = CliRunner()
-        result = runner.invoke(cleanup_logs, ["--dry-run"])
+        result = cli_runner.invoke(
+            cleanup_logs, ["--dry-run", "--set-retention-days", "30"]
+        )
 
         assert result.exit_code == 0
         assert "DRY RUN" in result.output
+        assert "30 days" in result.output
+        mock_request_log.cleanup_old_logs.assert_not_called()
+        mock_request_log.set_retention_days.assert_not_called()
 
-    @patch("cli.RequestLog")
-    def test_cleanup_logs_actual_deletion(self, mock_request_log):
-        """Test cleanup_logs performs actual deletion."""
+    def test_cleanup_logs_leaves_retention_alone(self, mock_request_log, cli_runner):
+        """Test cleanup_logs without an explicit policy change deletes nothing."""
         from cli import cleanup_logs
 
-        mock_request_log.cleanup_old_logs.return_value = 50
+        result = cli_runner.invoke(cleanup_logs)
 
-        runner = CliRunner()
-        result = runner.invoke(cleanup_logs, ["--days", "30"])
+        assert result.exit_code == 0
+        assert "No log entries deleted" in result.output
+        mock_request_log.cleanup_old_logs.assert_called_once_with()
+        mock_request_log.set_retention_days.assert_not_called()
+
+    def test_cleanup_logs_days_is_deprecated(self, mock_request_log, cli_runner):
+        """Test the ignored --days option warns instead of silently doing nothing."""
+        from cli import cleanup_logs
+
+        result = cli_runner.invoke(cleanup_logs, ["--days", "30"])
 
         assert result.exit_code == 0
-        assert "Successfully deleted" in result.output
-        assert "50" in result.output
-        mock_request_log.cleanup_old_logs.assert_called_once_with(30)
+        assert "--days is deprecated" in result.output
+        mock_request_log.cleanup_old_logs.assert_called_once_with()
+        mock_request_log.set_retention_days.assert_not_called()
+
+    def test_cleanup_logs_set_retention(self, mock_request_log, cli_runner):
+        """Test cleanup_logs updates the retention policy only when asked."""
+        from cli import cleanup_logs
+
+        mock_request_log.set_retention_days.return_value = True
+
+        result = cli_runner.invoke(cleanup_logs, ["--set-retention-days", "30"])
 
-    @patch("cli.RequestLog")
-    def test_cleanup_logs_error(self, mock_request_log):
+        assert result.exit_code == 0
+        assert "retention policy set to 30 days" in result.output
+        mock_request_log.set_retention_days.assert_called_once_with(30)
+
+    def test_cleanup_logs_rejects_short_retention(self, mock_request_log, cli_runner):
+        """Test cleanup_logs rejects retention periods below one day."""
+        from cli import cleanup_logs
+
+        result = cli_runner.invoke(cleanup_logs, ["--set-retention-days", "0"])
+
+        assert result.exit_code != 0
+        mock_request_log.set_retention_days.assert_not_called()
+
+    def test_cleanup_logs_error(self, mock_request_log, cli_runner):
         """Test cleanup_logs handles errors."""
         from cli import cleanup_logs
 
         mock_request_log.cleanup_old_logs.side_effect = Exception("DB error")
 
-        runner = CliRunner()
-        result = runner.invoke(cleanup_logs)
+        result = cli_runner.invoke(cleanup_logs)
 
         assert result.exit_code == 1
         assert "Error during cleanup" in result.output
 
-    @patch("cli.RequestLog")
-    def test_stats_command(self, mock_request_log):
+    def test_stats_command(self, mock_request_log, cli_runner):
         """Test stats command displays statistics."""
         from cli import stats
 
-        mock_request_log.get_requests_count.side_effect = [100, 500, 800, 1000]
-        mock_request_log.get_top_domains.return_value = [
-            ("bondit.dk", 50),
-            ("example.com", 30),
-        ]
-        mock_request_log.get_validation_ratio.return_value = {
-            "total": 1000,
-            "valid": {"count": 800, "percentage": 80.0},
-            "invalid": {"count": 150, "percentage": 15.0},
-            "error": {"count": 50, "percentage": 5.0},
-        }
+        mock_request_log.get_requests_count.side_effect = _STATS_COUNTS
+        mock_request_log.get_top_domains.return_value = _TOP_DOMAINS
+        mock_request_log.get_validation_ratio.return_value = _VALIDATION_RATIO
 
-        runner = CliRunner()
-        result = runner.invoke(stats)
+        result = cli_runner.invoke(stats)
 
         assert result.exit_code == 0
         assert "Statistics" in result.output
         assert "bondit.dk" in result.output
 
-    @patch("cli.RequestLog")
-    def test_stats_error(self, mock_request_log):
+    def test_stats_error(self, mock_request_log, cli_runner):
         """Test stats command handles errors."""
         from cli import stats
 
         mock_request_log.get_requests_count.side_effect = Exception("DB error")
 
-        runner = CliRunner()
-        result = runner.invoke(stats)
+        result = cli_runner.invoke(stats)
 
         assert result.exit_code == 1
         assert "Error retrieving statistics" in result.output
 
-    @patch("cli.RequestLog")
-    def test_recent_requests_command(self, mock_request_log):
+    def test_recent_requests_command(self, mock_request_log, cli_runner):
         """Test recent_requests command."""
         from cli import recent_requests
 
         mock_request_log.get_requests_count.return_value = 100
-        mock_request_log.get_hourly_requests.return_value = [
-            ("2024-01-01 12:00", 50),
-            ("2024-01-01 13:00", 50),
-        ]
+        mock_request_log.get_hourly_requests.return_value = _HOURLY_REQUESTS
 
-        runner = CliRunner()
-        result = runner.invoke(recent_requests, ["--hours", "24"])
+        result = cli_runner.invoke(recent_requests, ["--hours", "24"])
 
         assert result.exit_code == 0
         assert "Request Statistics" in result.output
         assert "100" in result.output
 
-    @patch("cli.RequestLog")
-    def test_recent_requests_no_data(self, mock_request_log):
+    def test_recent_requests_no_data(self, mock_request_log, cli_runner):
         """Test recent_requests when no requests found."""
         from cli import recent_requests
 
         mock_request_log.get_requests_count.return_value = 0
 
-        runner = CliRunner()
-        result = runner.invoke(recent_requests)
+        result = cli_runner.invoke(recent_requests)
 
         assert result.exit_code == 0
         assert "No requests found" in result.output
 
-    @patch("cli.RequestLog")
-    def test_recent_requests_error(self, mock_request_log):
+    def test_recent_requests_error(self, mock_request_log, cli_runner):
         """Test recent_requests handles errors."""
         from cli import recent_requests
 
         mock_request_log.get_requests_count.side_effect = Exception("DB error")
 
-        runner = CliRunner()
-        result = runner.invoke(recent_requests)
+        result = cli_runner.invoke(recent_requests)
 
         assert result.exit_code == 1
         assert "Error retrieving recent requests" in result.output
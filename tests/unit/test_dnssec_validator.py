@@ -4,51 +4,81 @@ Tests DNSSEC validation logic with mocked DNS responses.
 """
 
 import pytest
+from types import SimpleNamespace
+import threading
+from concurrent.futures import Future
 import time
+from collections import namedtuple
+from functools import lru_cache
 import dns.name
 import dns.resolver
 import dns.dnssec
-from unittest.mock import MagicMock, patch, Mock
+from unittest.mock import patch
 from datetime import datetime
 
-import sys
-import os
-
-# Add paths for imports
-app_path = os.path.join(os.path.dirname(__file__), "..", "..", "app")
-fixtures_path = os.path.join(os.path.dirname(__file__), "..", "fixtures")
-sys.path.insert(0, app_path)
-sys.path.insert(0, fixtures_path)
-
+import dnssec_validator
 from dnssec_validator import DNSSECValidator
 from dns_responses import (
     create_mock_dnskey_rrset,
     create_mock_ds_rrset,
     create_mock_rrsig_rrset,
     get_dns_response,
+    make_resolver_side_effect,
+    parse_name,
 )
 from test_domains import VALID_DOMAINS, UNSIGNED_DOMAINS
 
+# bondit.dk name and signed-zone rrsets, built once at import; the validator
+# only reads them
+_BONDIT_NAME = parse_name("bondit.dk")
+_DNSKEY_RRSET_BONDIT = create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13)
+_DS_RRSET_BONDIT = create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13)
+
+# Resolver answers for bondit.dk keyed by record type
+_BONDIT_ANSWERS = {
+    "DNSKEY": SimpleNamespace(rrset=_DNSKEY_RRSET_BONDIT),
+    "DS": SimpleNamespace(rrset=_DS_RRSET_BONDIT),
+}
+
+_BonditMocks = namedtuple("_BonditMocks", ["name", "dnskey_rrset", "ds_rrset"])
+
+
+@pytest.fixture
+def _stub_tlsa(monkeypatch):
+    """Skip the TLSA summary lookup that validate() runs after the chain check."""
+    monkeypatch.setattr(DNSSECValidator, "_add_tlsa_summary", lambda self: None)
+
+
+@pytest.fixture(scope="session")
+def bondit_mocks():
+    """Shared bondit.dk name and DNSKEY/DS rrsets."""
+    return _BonditMocks(_BONDIT_NAME, _DNSKEY_RRSET_BONDIT, _DS_RRSET_BONDIT)
+
+
+@pytest.fixture(scope="module")
+def bondit_validator():
+    """A freshly initialized bondit.dk validator; tests must not mutate it."""
+    return DNSSECValidator("bondit.dk")
+
 
 @pytest.mark.unit
 class TestDNSSECValidatorInitialization:
     """Test DNSSECValidator initialization."""
 
-    def test_init_with_valid_domain(self):
+    def test_init_with_valid_domain(self, bondit_validator):
         """Test initialization with a valid domain name."""
-        validator = DNSSECValidator("bondit.dk")
-        assert validator.domain == "bondit.dk"
-        assert validator.domain_name == dns.name.from_text("bondit.dk")
-        assert validator.results["domain"] == "bondit.dk"
-        assert validator.results["status"] == "unknown"
-        assert "chain_of_trust" in validator.results
-        assert "records" in validator.results
+        assert bondit_validator.domain == "bondit.dk"
+        assert bondit_validator.domain_name == _BONDIT_NAME
+        assert bondit_validator.results["domain"] == "bondit.dk"
+        assert bondit_validator.results["status"] == "unknown"
+        assert "chain_of_trust" in bondit_validator.results
+        assert "records" in bondit_validator.results
 
     def test_init_with_subdomain(self):
         """Test initialization with a subdomain."""
         validator = DNSSECValidator("www.bondit.dk")
         assert validator.domain == "www.bondit.dk"
-        assert validator.domain_name == dns.name.from_text("www.bondit.dk")
+        assert validator.domain_name == parse_name("www.bondit.dk")
 
     def test_init_with_fqdn(self):
         """Test initialization with fully qualified domain name (trailing dot)."""
@@ -57,75 +87,59 @@ class TestDNSSECValidatorInitialization:
         # dnspython should handle this correctly
         assert str(validator.domain_name).endswith(".")
 
-    def test_results_structure(self):
-        """Test that results structure is properly initialized."""
+    def test_results_built_lazily(self):
+        """Test that the results dict is only allocated on first access."""
         validator = DNSSECValidator("bondit.dk")
-        assert isinstance(validator.results, dict)
-        assert validator.results["domain"] == "bondit.dk"
-        assert validator.results["status"] == "unknown"
-        assert isinstance(validator.results["chain_of_trust"], list)
-        assert isinstance(validator.results["records"], dict)
-        assert "dnskey" in validator.results["records"]
-        assert "ds" in validator.results["records"]
-        assert "rrsig" in validator.results["records"]
-        assert isinstance(validator.results["errors"], list)
+        assert "results" not in vars(validator)
+        assert validator.results is validator.results
+
+    def test_results_structure(self, bondit_validator):
+        """Test that results structure is properly initialized."""
+        assert isinstance(bondit_validator.results, dict)
+        assert bondit_validator.results["domain"] == "bondit.dk"
+        assert bondit_validator.results["status"] == "unknown"
+        assert isinstance(bondit_validator.results["chain_of_trust"], list)
+        assert isinstance(bondit_validator.results["records"], dict)
+        assert "dnskey" in bondit_validator.results["records"]
+        assert "ds" in bondit_validator.results["records"]
+        assert "rrsig" in bondit_validator.results["records"]
+        assert isinstance(bondit_validator.results["errors"], list)
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECValidationBasic:
     """Test basic DNSSEC validation scenarios."""
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_valid_domain(self, mock_resolver_class):
+    def test_validate_valid_domain(self, bondit_mocks, mock_resolver, mock_key_id):
         """Test validation of a domain with valid DNSSEC."""
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses
-        dnskey_rrset = create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13)
-        ds_rrset = create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13)
+        dnskey_rrset = bondit_mocks.dnskey_rrset
+        ds_rrset = bondit_mocks.ds_rrset
 
         # Mock the resolve method to return appropriate responses
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            else:
-                raise dns.resolver.NoAnswer()
-            return mock_answer
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        # Create validator and validate
+        validator = DNSSECValidator("bondit.dk")
+        result = validator.validate()
 
-        # Mock dns.dnssec.key_id to return consistent key tag
-        with patch("dns.dnssec.key_id", return_value=12345):
-            # Create validator and validate
-            validator = DNSSECValidator("bondit.dk")
-            with patch.object(validator, "_add_tlsa_summary"):  # Skip TLSA check
-                result = validator.validate()
-
-            # Assertions
-            assert result["domain"] == "bondit.dk"
-            assert result["status"] == "valid"
-            assert len(result["chain_of_trust"]) > 0
-            assert result["chain_of_trust"][0]["status"] == "valid"
-
-    @patch("dns.resolver.Resolver")
-    def test_validate_unsigned_domain(self, mock_resolver_class):
-        """Test validation of a domain without DNSSEC."""
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
+        # Assertions
+        assert result["domain"] == "bondit.dk"
+        assert result["status"] == "valid"
+        assert len(result["chain_of_trust"]) > 0
+        assert result["chain_of_trust"][0]["status"] == "valid"
 
+    def test_validate_unsigned_domain(self, mock_resolver):
+        """Test validation of a domain without DNSSEC."""
         # Mock resolver to raise exception for DNSKEY query
         mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
 
         # Create validator and validate
         validator = DNSSECValidator("example.org")
-        with patch.object(validator, "_add_tlsa_summary"):
-            result = validator.validate()
+        result = validator.validate()
 
         # Assertions
         assert result["domain"] == "example.org"
@@ -134,33 +148,21 @@ class TestDNSSECValidationBasic:
         assert result["chain_of_trust"][0]["status"] == "insecure"
         assert "No DNSKEY records" in result["chain_of_trust"][0]["error"]
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_broken_chain(self, mock_resolver_class):
+    def test_validate_broken_chain(self, mock_resolver):
         """Test validation of a domain with broken DNSSEC chain."""
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses - DNSKEY exists but no DS
         dnskey_rrset = create_mock_dnskey_rrset(
             "broken-dnssec.example", flags=257, algorithm=8
         )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                # No DS record - breaks the chain
-                raise dns.resolver.NoAnswer()
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        # No DS record - breaks the chain
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset
+        )
 
         # Create validator and validate
         validator = DNSSECValidator("broken-dnssec.example")
-        with patch.object(validator, "_add_tlsa_summary"):
-            result = validator.validate()
+        result = validator.validate()
 
         # Assertions
         assert result["domain"] == "broken-dnssec.example"
@@ -169,59 +171,95 @@ class TestDNSSECValidationBasic:
         assert result["chain_of_trust"][0]["status"] == "invalid"
         assert "no ds record" in result["chain_of_trust"][0]["error"].lower()
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_mismatched_keys(self, mock_resolver_class):
+    def test_validate_mismatched_keys(self, mock_resolver, mock_key_id):
         """Test validation with mismatched DS and DNSKEY key tags."""
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses with mismatched key tags
         dnskey_rrset = create_mock_dnskey_rrset("bogus.example", flags=257, algorithm=8)
         ds_rrset = create_mock_ds_rrset(
             "bogus.example", key_tag=11111, algorithm=8
         )  # Different key tag
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_key_id.return_value = 22222
 
-        # Mock dns.dnssec.key_id to return different key tag
-        with patch("dns.dnssec.key_id", return_value=22222):
-            # Create validator and validate
-            validator = DNSSECValidator("bogus.example")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
+        # Create validator and validate
+        validator = DNSSECValidator("bogus.example")
+        result = validator.validate()
 
-            # Assertions
-            assert result["domain"] == "bogus.example"
-            assert result["status"] == "invalid"
-            assert len(result["chain_of_trust"]) > 0
-            assert result["chain_of_trust"][0]["status"] == "invalid"
-            assert "do not match" in result["chain_of_trust"][0]["error"].lower()
+        # Assertions
+        assert result["domain"] == "bogus.example"
+        assert result["status"] == "invalid"
+        assert len(result["chain_of_trust"]) > 0
+        assert result["chain_of_trust"][0]["status"] == "invalid"
+        assert "do not match" in result["chain_of_trust"][0]["error"].lower()
+
+    def test_validate_runs_tlsa_summary_in_worker(self, monkeypatch):
+        """Test the TLSA summary runs off-thread while CAA runs inline."""
+        threads = {}
+
+        def record(key):
+            def step(self):
+                threads[key] = threading.current_thread().name
+                summary = {"status": "no_records"}
+                if key == "caa_summary":
+                    self.results[key] = summary
+                return summary
+
+            return step
+
+        monkeypatch.setattr(
+            DNSSECValidator, "_validate_chain_of_trust", lambda self: True
+        )
+        monkeypatch.setattr(
+            DNSSECValidator, "_add_tlsa_summary", record("tlsa_summary")
+        )
+        monkeypatch.setattr(DNSSECValidator, "_add_caa_summary", record("caa_summary"))
+
+        result = DNSSECValidator("bondit.dk").validate()
+
+        assert result["status"] == "valid"
+        assert result["tlsa_summary"] == {"status": "no_records"}
+        assert result["caa_summary"] == {"status": "no_records"}
+        assert threads["tlsa_summary"].startswith("dnssec-summary")
+        assert threads["caa_summary"] == threading.current_thread().name
+
+    def test_validate_bounds_tlsa_summary_wait(self, monkeypatch):
+        """Test a stuck TLSA summary is cancelled and reported as an error."""
+        pending = Future()
+        monkeypatch.setattr(dnssec_validator, "_SUMMARY_TIMEOUT", 0.01)
+        monkeypatch.setattr(
+            dnssec_validator,
+            "_SUMMARY_EXECUTOR",
+            SimpleNamespace(submit=lambda fn: pending),
+        )
+        monkeypatch.setattr(
+            DNSSECValidator, "_validate_chain_of_trust", lambda self: True
+        )
+        monkeypatch.setattr(DNSSECValidator, "_add_caa_summary", lambda self: None)
+
+        result = DNSSECValidator("bondit.dk").validate()
+
+        assert result["status"] == "valid"
+        assert result["tlsa_summary"]["status"] == "error"
+        assert pending.cancelled()
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECValidationWithFallback:
     """Test DNSSEC validation with subdomain fallback logic."""
 
     @patch("dnssec_validator.get_fallback_domains")
-    @patch("dns.resolver.Resolver")
-    def test_fallback_to_root_domain(self, mock_resolver_class, mock_get_fallback):
+    def test_fallback_to_root_domain(
+        self, mock_get_fallback, mock_resolver, mock_key_id
+    ):
         """Test fallback from subdomain to root domain."""
         # Mock get_fallback_domains to return subdomain and root
         mock_get_fallback.return_value = ["www.bondit.dk", "bondit.dk"]
 
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Track which validator instance (domain) is being used
         domain_attempts = []
 
@@ -229,229 +267,147 @@ class TestDNSSECValidationWithFallback:
             zone_str = str(zone) if hasattr(zone, "__str__") else zone
             domain_attempts.append(zone_str)
 
-            mock_answer = MagicMock()
-            if "www" in zone_str:
+            if "www" in zone_str or record_type not in _BONDIT_ANSWERS:
                 # First domain (www.bondit.dk) - fail with no DNSKEY
                 raise dns.resolver.NoAnswer()
-            else:
-                # Second domain (bondit.dk) - return valid DNSSEC
-                if record_type == "DNSKEY":
-                    mock_answer.rrset = create_mock_dnskey_rrset(
-                        "bondit.dk", flags=257, algorithm=13
-                    )
-                elif record_type == "DS":
-                    mock_answer.rrset = create_mock_ds_rrset(
-                        "bondit.dk", key_tag=12345, algorithm=13
-                    )
-                return mock_answer
+            # Second domain (bondit.dk) - return valid DNSSEC
+            return _BONDIT_ANSWERS[record_type]
 
         mock_resolver.resolve.side_effect = resolve_side_effect
 
-        # Mock dns.dnssec.key_id
-        with patch("dns.dnssec.key_id", return_value=12345):
-            # Create validator and validate with fallback
-            validator = DNSSECValidator("www.bondit.dk")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate_with_fallback(
-                    original_input="www.bondit.dk"
-                )
-
-            # Assertions - the fallback logic should have tried www first, then bondit.dk
-            assert "fallback_info" in result
-            assert result["fallback_info"]["original_input"] == "www.bondit.dk"
-            # Check if fallback was used or multiple attempts were made
-            assert result["fallback_info"]["total_attempts"] >= 1
+        # Create validator and validate with fallback
+        validator = DNSSECValidator("www.bondit.dk")
+        result = validator.validate_with_fallback(original_input="www.bondit.dk")
+
+        # Assertions - the fallback logic should have tried www first, then bondit.dk
+        assert "fallback_info" in result
+        assert result["fallback_info"]["original_input"] == "www.bondit.dk"
+        # Check if fallback was used or multiple attempts were made
+        assert result["fallback_info"]["total_attempts"] >= 1
 
     @patch("dnssec_validator.get_fallback_domains")
-    @patch("dns.resolver.Resolver")
-    def test_no_fallback_for_root_domain(self, mock_resolver_class, mock_get_fallback):
+    def test_no_fallback_for_root_domain(
+        self, mock_get_fallback, bondit_mocks, mock_resolver, mock_key_id
+    ):
         """Test that root domain doesn't trigger fallback."""
         # Mock get_fallback_domains to return only the domain itself
         mock_get_fallback.return_value = ["bondit.dk"]
 
-        # Setup mock resolver
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Mock valid DNSSEC response
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = create_mock_dnskey_rrset(
-                    "bondit.dk", flags=257, algorithm=13
-                )
-            elif record_type == "DS":
-                mock_answer.rrset = create_mock_ds_rrset(
-                    "bondit.dk", key_tag=12345, algorithm=13
-                )
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=bondit_mocks.dnskey_rrset, ds_rrset=bondit_mocks.ds_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=12345):
-            validator = DNSSECValidator("bondit.dk")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate_with_fallback()
+        validator = DNSSECValidator("bondit.dk")
+        result = validator.validate_with_fallback()
 
-            # Assertions
-            assert result["fallback_info"]["fallback_used"] is False
-            assert result["fallback_info"]["validated_domain"] == "bondit.dk"
+        # Assertions
+        assert result["fallback_info"]["fallback_used"] is False
+        assert result["fallback_info"]["validated_domain"] == "bondit.dk"
 
 
 @pytest.mark.unit
 class TestDNSSECQueryMethods:
     """Test DNS query methods."""
 
-    @patch("dns.resolver.Resolver")
-    def test_query_dnskey_success(self, mock_resolver_class):
+    def test_query_dnskey_success(self, mock_resolver):
         """Test successful DNSKEY query."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
-        mock_answer = MagicMock()
-        mock_answer.rrset = create_mock_dnskey_rrset("bondit.dk")
+        mock_answer = SimpleNamespace(rrset=create_mock_dnskey_rrset("bondit.dk"))
         mock_resolver.resolve.return_value = mock_answer
 
         validator = DNSSECValidator("bondit.dk")
-        result = validator._query_dnskey(dns.name.from_text("bondit.dk"))
+        result = validator._query_dnskey(_BONDIT_NAME)
 
         assert result is not None
-        mock_resolver.resolve.assert_called_once_with(
-            dns.name.from_text("bondit.dk"), "DNSKEY"
-        )
+        assert mock_resolver.resolve.call_count == 1
+        assert mock_resolver.resolve.call_args.args == (_BONDIT_NAME, "DNSKEY")
 
-    @patch("dns.resolver.Resolver")
-    def test_query_dnskey_no_answer(self, mock_resolver_class):
+    def test_query_dnskey_no_answer(self, mock_resolver):
         """Test DNSKEY query when no answer."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
         mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
 
         validator = DNSSECValidator("example.org")
-        result = validator._query_dnskey(dns.name.from_text("example.org"))
+        result = validator._query_dnskey(parse_name("example.org"))
 
         assert result is None
 
-    @patch("dns.resolver.Resolver")
-    def test_query_ds_success(self, mock_resolver_class):
+    def test_query_ds_success(self, mock_resolver):
         """Test successful DS query."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
-        mock_answer = MagicMock()
-        mock_answer.rrset = create_mock_ds_rrset("bondit.dk")
+        mock_answer = SimpleNamespace(rrset=create_mock_ds_rrset("bondit.dk"))
         mock_resolver.resolve.return_value = mock_answer
 
         validator = DNSSECValidator("bondit.dk")
-        result = validator._query_ds(dns.name.from_text("bondit.dk"), None)
+        result = validator._query_ds(_BONDIT_NAME, None)
 
         assert result is not None
-        mock_resolver.resolve.assert_called_once_with(
-            dns.name.from_text("bondit.dk"), "DS"
-        )
+        assert mock_resolver.resolve.call_count == 1
+        assert mock_resolver.resolve.call_args.args == (_BONDIT_NAME, "DS")
 
-    @patch("dns.resolver.Resolver")
-    def test_query_ds_no_answer(self, mock_resolver_class):
+    def test_query_ds_no_answer(self, mock_resolver):
         """Test DS query when no answer."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
         mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
 
         validator = DNSSECValidator("broken.example")
-        result = validator._query_ds(dns.name.from_text("broken.example"), None)
+        result = validator._query_ds(parse_name("broken.example"), None)
 
         assert result is None
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECErrorHandling:
     """Test error handling in DNSSEC validation."""
 
-    @patch("dns.resolver.Resolver")
-    def test_validation_with_network_error(self, mock_resolver_class):
-        """Test validation when DNS query fails with network error."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = Exception("Network error")
-
-        validator = DNSSECValidator("bondit.dk")
-        with patch.object(validator, "_add_tlsa_summary"):
-            result = validator.validate()
-
-        # Network errors during DNS query result in insecure status
+    @pytest.mark.parametrize(
+        "domain,exc",
+        [
+            ("bondit.dk", Exception("Network error")),
+            ("bondit.dk", dns.resolver.Timeout()),
+            ("nonexistent.example", dns.resolver.NXDOMAIN()),
+        ],
+        ids=["network_error", "timeout", "nxdomain"],
+    )
+    def test_validation_with_query_error(self, mock_resolver, domain, exc):
+        """Test validation when every DNS query fails."""
+        mock_resolver.resolve.side_effect = exc
+
+        validator = DNSSECValidator(domain)
+        result = validator.validate()
+
+        # Failed DNS queries result in an error or insecure status
         assert result["status"] in ["error", "insecure"]
         assert len(result["errors"]) > 0 or len(result["chain_of_trust"]) > 0
 
-    @patch("dns.resolver.Resolver")
-    def test_validation_with_timeout(self, mock_resolver_class):
-        """Test validation when DNS query times out."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.resolver.Timeout()
-
-        validator = DNSSECValidator("bondit.dk")
-        with patch.object(validator, "_add_tlsa_summary"):
-            result = validator.validate()
-
-        assert result["status"] in ["error", "insecure"]
-
-    @patch("dns.resolver.Resolver")
-    def test_validation_with_nxdomain(self, mock_resolver_class):
-        """Test validation when domain doesn't exist."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-        mock_resolver.resolve.side_effect = dns.resolver.NXDOMAIN()
-
-        validator = DNSSECValidator("nonexistent.example")
-        with patch.object(validator, "_add_tlsa_summary"):
-            result = validator.validate()
-
-        assert result["status"] in ["error", "insecure"]
-
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECAlgorithmSupport:
     """Test DNSSEC validation with different cryptographic algorithms."""
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_rsa_sha256_algorithm(self, mock_resolver_class):
+    def test_validate_rsa_sha256_algorithm(self, mock_resolver, mock_key_id):
         """Test validation with RSA/SHA-256 (algorithm 8)."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses for RSA/SHA-256 (algorithm 8)
         dnskey_rrset = create_mock_dnskey_rrset(
             "rsa-example.com", flags=257, algorithm=8
         )
         ds_rrset = create_mock_ds_rrset("rsa-example.com", key_tag=11111, algorithm=8)
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=11111):
-            validator = DNSSECValidator("rsa-example.com")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
+        mock_key_id.return_value = 11111
+        validator = DNSSECValidator("rsa-example.com")
+        result = validator.validate()
 
-            # Verify validation succeeds with RSA/SHA-256 (algorithm 8)
-            assert result["status"] == "valid"
-            assert result["domain"] == "rsa-example.com"
-            assert len(result["chain_of_trust"]) > 0
-            assert len(result["records"]["dnskey"]) > 0
+        # Verify validation succeeds with RSA/SHA-256 (algorithm 8)
+        assert result["status"] == "valid"
+        assert result["domain"] == "rsa-example.com"
+        assert len(result["chain_of_trust"]) > 0
+        assert len(result["records"]["dnskey"]) > 0
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_ecdsa_p256_algorithm(self, mock_resolver_class):
+    def test_validate_ecdsa_p256_algorithm(self, mock_resolver, mock_key_id):
         """Test validation with ECDSA P-256 (algorithm 13)."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses for ECDSA P-256 (algorithm 13)
         dnskey_rrset = create_mock_dnskey_rrset(
             "ecdsa-example.com", flags=257, algorithm=13
@@ -460,33 +416,22 @@ class TestDNSSECAlgorithmSupport:
             "ecdsa-example.com", key_tag=22222, algorithm=13
         )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=22222):
-            validator = DNSSECValidator("ecdsa-example.com")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
+        mock_key_id.return_value = 22222
+        validator = DNSSECValidator("ecdsa-example.com")
+        result = validator.validate()
 
-            # Verify validation succeeds with ECDSA P-256 (algorithm 13)
-            assert result["status"] == "valid"
-            assert result["domain"] == "ecdsa-example.com"
-            assert len(result["chain_of_trust"]) > 0
-            assert len(result["records"]["dnskey"]) > 0
+        # Verify validation succeeds with ECDSA P-256 (algorithm 13)
+        assert result["status"] == "valid"
+        assert result["domain"] == "ecdsa-example.com"
+        assert len(result["chain_of_trust"]) > 0
+        assert len(result["records"]["dnskey"]) > 0
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_eddsa_algorithm(self, mock_resolver_class):
+    def test_validate_eddsa_algorithm(self, mock_resolver, mock_key_id):
         """Test validation with Ed25519 (algorithm 15)."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses for Ed25519 (algorithm 15)
         dnskey_rrset = create_mock_dnskey_rrset(
             "eddsa-example.com", flags=257, algorithm=15
@@ -495,38 +440,28 @@ class TestDNSSECAlgorithmSupport:
             "eddsa-example.com", key_tag=33333, algorithm=15
         )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=33333):
-            validator = DNSSECValidator("eddsa-example.com")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
+        mock_key_id.return_value = 33333
+        validator = DNSSECValidator("eddsa-example.com")
+        result = validator.validate()
 
-            # Verify validation succeeds with Ed25519 (algorithm 15)
-            assert result["status"] == "valid"
-            assert result["domain"] == "eddsa-example.com"
-            assert len(result["chain_of_trust"]) > 0
-            assert len(result["records"]["dnskey"]) > 0
+        # Verify validation succeeds with Ed25519 (algorithm 15)
+        assert result["status"] == "valid"
+        assert result["domain"] == "eddsa-example.com"
+        assert len(result["chain_of_trust"]) > 0
+        assert len(result["records"]["dnskey"]) > 0
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECExpiredSignatures:
     """Test DNSSEC validation with expired or invalid RRSIG records."""
 
-    @patch("dns.resolver.Resolver")
-    def test_validate_expired_rrsig(self, mock_resolver_class):
+    def test_validate_expired_rrsig(self, mock_resolver, mock_key_id):
         """Test validation fails when RRSIG is expired."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses
         dnskey_rrset = create_mock_dnskey_rrset(
             "expired.example", flags=257, algorithm=13
@@ -544,40 +479,27 @@ class TestDNSSECExpiredSignatures:
             inception=inception_time,
         )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            elif record_type == "RRSIG":
-                mock_answer.rrset = rrsig_rrset
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset, rrsig_rrset=rrsig_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=44444):
-            validator = DNSSECValidator("expired.example")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
-
-            # Test passes if validation completes
-            # Note: Current implementation doesn't validate RRSIG timestamps
-            # This test documents expected behavior for future implementation
-            assert result["domain"] == "expired.example"
-            # RRSIG should be stored with expiration time
-            if len(result["records"]["rrsig"]) > 0:
-                rrsig = result["records"]["rrsig"][0]
-                assert rrsig["expiration"] == expired_time
-                # Future enhancement: Should detect expiration
-                # assert result["status"] in ["invalid", "error"]
-
-    @patch("dns.resolver.Resolver")
-    def test_validate_not_yet_valid_rrsig(self, mock_resolver_class):
+        mock_key_id.return_value = 44444
+        validator = DNSSECValidator("expired.example")
+        result = validator.validate()
+
+        # Test passes if validation completes
+        # Note: Current implementation doesn't validate RRSIG timestamps
+        # This test documents expected behavior for future implementation
+        assert result["domain"] == "expired.example"
+        # RRSIG should be stored with expiration time
+        if len(result["records"]["rrsig"]) > 0:
+            rrsig = result["records"]["rrsig"][0]
+            assert rrsig["expiration"] == expired_time
+            # Future enhancement: Should detect expiration
+            # assert result["status"] in ["invalid", "error"]
+
+    def test_validate_not_yet_valid_rrsig(self, mock_resolver, mock_key_id):
         """Test validation fails when RRSIG inception is in the future."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Create mock responses
         dnskey_rrset = create_mock_dnskey_rrset(
             "future.example", flags=257, algorithm=13
@@ -596,99 +518,67 @@ class TestDNSSECExpiredSignatures:
             inception=inception_time,
         )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            elif record_type == "RRSIG":
-                mock_answer.rrset = rrsig_rrset
-            return mock_answer
-
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset, rrsig_rrset=rrsig_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=55555):
-            validator = DNSSECValidator("future.example")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
+        mock_key_id.return_value = 55555
+        validator = DNSSECValidator("future.example")
+        result = validator.validate()
 
-            # Test passes if validation completes
-            # Note: Current implementation doesn't validate RRSIG inception times
-            # This test documents expected behavior for future implementation
-            assert result["domain"] == "future.example"
-            # RRSIG should be stored with inception time
-            if len(result["records"]["rrsig"]) > 0:
-                rrsig = result["records"]["rrsig"][0]
-                assert rrsig["inception"] == inception_time
-                # Future enhancement: Should detect future inception
-                # assert result["status"] in ["invalid", "error"]
+        # Test passes if validation completes
+        # Note: Current implementation doesn't validate RRSIG inception times
+        # This test documents expected behavior for future implementation
+        assert result["domain"] == "future.example"
+        # RRSIG should be stored with inception time
+        if len(result["records"]["rrsig"]) > 0:
+            rrsig = result["records"]["rrsig"][0]
+            assert rrsig["inception"] == inception_time
+            # Future enhancement: Should detect future inception
+            # assert result["status"] in ["invalid", "error"]
 
 
 @pytest.mark.unit
+@pytest.mark.usefixtures("_stub_tlsa")
 class TestDNSSECRecordStorage:
     """Test that DNSSEC records are properly stored in results."""
 
-    @patch("dns.resolver.Resolver")
-    def test_dnskey_records_stored(self, mock_resolver_class):
+    def test_dnskey_records_stored(self, bondit_mocks, mock_resolver, mock_key_id):
         """Test that DNSKEY records are stored in results."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
+        dnskey_rrset = bondit_mocks.dnskey_rrset
+        ds_rrset = bondit_mocks.ds_rrset
 
-        dnskey_rrset = create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13)
-        ds_rrset = create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13)
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
+        validator = DNSSECValidator("bondit.dk")
+        result = validator.validate()
 
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        # Check DNSKEY records are stored
+        assert len(result["records"]["dnskey"]) > 0
+        dnskey_record = result["records"]["dnskey"][0]
+        assert "flags" in dnskey_record
+        assert "protocol" in dnskey_record
+        assert "algorithm" in dnskey_record
+        assert "key_tag" in dnskey_record
 
-        with patch("dns.dnssec.key_id", return_value=12345):
-            validator = DNSSECValidator("bondit.dk")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
-
-            # Check DNSKEY records are stored
-            assert len(result["records"]["dnskey"]) > 0
-            dnskey_record = result["records"]["dnskey"][0]
-            assert "flags" in dnskey_record
-            assert "protocol" in dnskey_record
-            assert "algorithm" in dnskey_record
-            assert "key_tag" in dnskey_record
-
-    @patch("dns.resolver.Resolver")
-    def test_ds_records_stored(self, mock_resolver_class):
+    def test_ds_records_stored(self, bondit_mocks, mock_resolver, mock_key_id):
         """Test that DS records are stored in results."""
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
-        dnskey_rrset = create_mock_dnskey_rrset("bondit.dk", flags=257, algorithm=13)
-        ds_rrset = create_mock_ds_rrset("bondit.dk", key_tag=12345, algorithm=13)
-
-        def resolve_side_effect(zone, record_type):
-            mock_answer = MagicMock()
-            if record_type == "DNSKEY":
-                mock_answer.rrset = dnskey_rrset
-            elif record_type == "DS":
-                mock_answer.rrset = ds_rrset
-            return mock_answer
+        dnskey_rrset = bondit_mocks.dnskey_rrset
+        ds_rrset = bondit_mocks.ds_rrset
 
-        mock_resolver.resolve.side_effect = resolve_side_effect
+        mock_resolver.resolve.side_effect = make_resolver_side_effect(
+            dnskey_rrset=dnskey_rrset, ds_rrset=ds_rrset
+        )
 
-        with patch("dns.dnssec.key_id", return_value=12345):
-            validator = DNSSECValidator("bondit.dk")
-            with patch.object(validator, "_add_tlsa_summary"):
-                result = validator.validate()
-
-            # Check DS records are stored
-            assert len(result["records"]["ds"]) > 0
-            ds_record = result["records"]["ds"][0]
-            assert "key_tag" in ds_record
-            assert "algorithm" in ds_record
-            assert "digest_type" in ds_record
-            assert "digest" in ds_record
+        validator = DNSSECValidator("bondit.dk")
+        result = validator.validate()
+
+        # Check DS records are stored
+        assert len(result["records"]["ds"]) > 0
+        ds_record = result["records"]["ds"][0]
+        assert "key_tag" in ds_record
+        assert "algorithm" in ds_record
+        assert "digest_type" in ds_record
+        assert "digest" in ds_record
@@ -3,75 +3,60 @@ Unit tests for the SHOW_DOMAIN_CHECK_HISTORY feature: feature flag,
 per-domain InfluxDB query helpers, and the /api/analytics/domain/<domain> endpoint.
 """
 
-import os
-import sys
-import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../app"))
+import pytest
 
+from app import inject_domain_check_history, show_domain_check_history
+from models import InfluxDBLogger, RequestLog
+
+
+# The flag is read on every call, so tests flip it with monkeypatch instead of
+# reloading the app module; this keeps the file safe under pytest-xdist
+@pytest.fixture(autouse=True)
+def _clean_history_env(monkeypatch):
+    """Start every test with SHOW_DOMAIN_CHECK_HISTORY unset"""
+    monkeypatch.delenv("SHOW_DOMAIN_CHECK_HISTORY", raising=False)
 
-class TestDomainHistoryFeatureFlag(unittest.TestCase):
-    """Test SHOW_DOMAIN_CHECK_HISTORY environment flag parsing."""
 
-    def setUp(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
+@pytest.fixture
+def history_enabled(monkeypatch):
+    """Enable the domain check history feature for one test"""
+    monkeypatch.setenv("SHOW_DOMAIN_CHECK_HISTORY", "true")
 
-    def tearDown(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
+
+class TestDomainHistoryFeatureFlag:
+    """Test SHOW_DOMAIN_CHECK_HISTORY environment flag parsing."""
 
     def test_disabled_by_default(self):
-        import importlib
-        import app as app_module
-
-        importlib.reload(app_module)
-        self.assertFalse(app_module.show_domain_check_history())
-
-    def test_enabled_with_true_values(self):
-        import importlib
-        import app as app_module
-
-        for value in ["true", "True", "TRUE", "1", "yes", "Yes", "YES"]:
-            os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = value
-            importlib.reload(app_module)
-            self.assertTrue(
-                app_module.show_domain_check_history(),
-                f"Expected True for SHOW_DOMAIN_CHECK_HISTORY={value}",
-            )
-
-    def test_disabled_with_false_values(self):
-        import importlib
-        import app as app_module
-
-        for value in ["false", "False", "0", "no", ""]:
-            os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = value
-            importlib.reload(app_module)
-            self.assertFalse(
-                app_module.show_domain_check_history(),
-                f"Expected False for SHOW_DOMAIN_CHECK_HISTORY={value}",
-            )
-
-    def test_context_processor_injects_flag(self):
-        import importlib
-        import app as app_module
-
-        os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = "true"
-        importlib.reload(app_module)
-        result = app_module.inject_domain_check_history()
-        self.assertIn("show_domain_check_history", result)
-        self.assertTrue(result["show_domain_check_history"])
-
-
-class TestInfluxDomainQueries(unittest.TestCase):
+        assert show_domain_check_history() is False
+
+    @pytest.mark.parametrize(
+        "value", ["true", "True", "TRUE", "1", "yes", "Yes", "YES"]
+    )
+    def test_enabled_with_true_values(self, monkeypatch, value):
+        monkeypatch.setenv("SHOW_DOMAIN_CHECK_HISTORY", value)
+        assert show_domain_check_history() is True
+
+    @pytest.mark.parametrize("value", ["false", "False", "0", "no", ""])
+    def test_disabled_with_false_values(self, monkeypatch, value):
+        monkeypatch.setenv("SHOW_DOMAIN_CHECK_HISTORY", value)
+        assert show_domain_check_history() is False
+
+    def test_context_processor_injects_flag(self, history_enabled):
+        result = inject_domain_check_history()
+        assert "show_domain_check_history" in result
+        assert result["show_domain_check_history"] is True
+
+
+class TestInfluxDomainQueries:
     """Test that domain filter is applied to InfluxDB queries."""
 
     def _make_logger_with_capture(self):
-        from models import InfluxDBLogger
-
         logger = InfluxDBLogger()
         captured = {}
 
-        def fake_execute(flux_query):
+        def fake_execute(flux_query, columns=None):
             captured["query"] = flux_query
             return []
 
@@ -81,81 +66,51 @@ class TestInfluxDomainQueries(unittest.TestCase):
     def test_get_requests_count_includes_domain_filter(self):
         logger, captured = self._make_logger_with_capture()
         logger.get_requests_count(hours=24, domain="example.com")
-        self.assertIn('r.domain == "example.com"', captured["query"])
+        assert 'r.domain == "example.com"' in captured["query"]
 
     def test_get_validation_ratio_includes_domain_filter(self):
         logger, captured = self._make_logger_with_capture()
         logger.get_validation_ratio(hours=24, domain="example.com")
-        self.assertIn('r.domain == "example.com"', captured["query"])
+        assert 'r.domain == "example.com"' in captured["query"]
 
     def test_get_hourly_requests_includes_domain_filter(self):
         logger, captured = self._make_logger_with_capture()
         logger.get_hourly_requests(hours=24, domain="example.com")
-        self.assertIn('r.domain == "example.com"', captured["query"])
+        assert 'r.domain == "example.com"' in captured["query"]
 
     def test_get_source_breakdown_includes_domain_filter(self):
         logger, captured = self._make_logger_with_capture()
         logger.get_source_breakdown(days=7, domain="example.com")
-        self.assertIn('r.domain == "example.com"', captured["query"])
+        assert 'r.domain == "example.com"' in captured["query"]
 
     def test_queries_without_domain_have_no_domain_filter(self):
         logger, captured = self._make_logger_with_capture()
         logger.get_requests_count(hours=24)
-        self.assertNotIn("r.domain == ", captured["query"])
+        assert "r.domain == " not in captured["query"]
 
 
-class TestDomainAnalyticsEndpoint(unittest.TestCase):
+class TestDomainAnalyticsEndpoint:
     """Test /api/analytics/domain/<domain> endpoint behavior."""
 
-    def setUp(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
-        # Disable rate limiting so test_client requests aren't throttled
-        os.environ["FLASK_ENV"] = "testing"
-
-    def tearDown(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
-
-    def _reload_app(self):
-        import importlib
-        import app as app_module
-
-        importlib.reload(app_module)
-        # Disable rate limiter for tests
-        app_module.limiter.enabled = False
-        return app_module
-
-    def test_endpoint_returns_404_when_feature_disabled(self):
-        app_module = self._reload_app()
-        with app_module.app.test_client() as client:
-            response = client.get("/api/analytics/domain/example.com")
-            self.assertEqual(response.status_code, 404)
-            self.assertIn("disabled", response.get_json()["error"].lower())
-
-    def test_endpoint_rejects_invalid_domain(self):
-        os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = "true"
-        app_module = self._reload_app()
-        with app_module.app.test_client() as client:
-            response = client.get("/api/analytics/domain/not_a_valid_domain")
-            self.assertEqual(response.status_code, 400)
-
-    def test_endpoint_rejects_invalid_period(self):
-        os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = "true"
-        app_module = self._reload_app()
-        with patch.object(
-            app_module.RequestLog, "get_domain_requests_count", return_value=0
-        ):
-            with app_module.app.test_client() as client:
-                response = client.get("/api/analytics/domain/example.com?period=99h")
-                self.assertEqual(response.status_code, 400)
+    def test_endpoint_returns_404_when_feature_disabled(self, client):
+        response = client.get("/api/analytics/domain/example.com")
+        assert response.status_code == 404
+        assert "disabled" in response.get_json()["error"].lower()
+
+    def test_endpoint_rejects_invalid_domain(self, client, history_enabled):
+        response = client.get("/api/analytics/domain/not_a_valid_domain")
+        assert response.status_code == 400
 
-    def test_endpoint_returns_aggregated_payload(self):
-        os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = "true"
-        app_module = self._reload_app()
+    def test_endpoint_rejects_invalid_period(self, client, history_enabled):
+        with patch.object(RequestLog, "get_domain_requests_count", return_value=0):
+            response = client.get("/api/analytics/domain/example.com?period=99h")
+            assert response.status_code == 400
 
+    def test_endpoint_returns_aggregated_payload(self, client, history_enabled):
         with patch.object(
-            app_module.RequestLog, "get_domain_requests_count", return_value=42
+            RequestLog, "get_domain_requests_count", return_value=42
         ), patch.object(
-            app_module.RequestLog,
+            RequestLog,
             "get_domain_validation_ratio",
             return_value={
                 "total": 42,
@@ -164,60 +119,36 @@ class TestDomainAnalyticsEndpoint(unittest.TestCase):
                 "error": {"count": 0, "percentage": 0},
             },
         ), patch.object(
-            app_module.RequestLog,
+            RequestLog,
             "get_domain_source_breakdown",
             return_value=[("external", 30), ("webapp", 12)],
         ), patch.object(
-            app_module.RequestLog,
+            RequestLog,
             "get_domain_hourly_requests",
             return_value=[("2026-05-16T10:00:00", 5), ("2026-05-16T11:00:00", 7)],
         ):
-            with app_module.app.test_client() as client:
-                response = client.get("/api/analytics/domain/example.com?period=24h")
-                self.assertEqual(response.status_code, 200)
-                data = response.get_json()
-                self.assertEqual(data["domain"], "example.com")
-                self.assertEqual(data["period"], "24h")
-                self.assertEqual(data["total_requests"], 42)
-                self.assertEqual(data["sources"], {"external": 30, "webapp": 12})
-                self.assertEqual(len(data["timeline"]), 2)
-                self.assertEqual(data["timeline"][0]["requests"], 5)
-
-
-class TestStatsTemplateRendering(unittest.TestCase):
+            response = client.get("/api/analytics/domain/example.com?period=24h")
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data["domain"] == "example.com"
+            assert data["period"] == "24h"
+            assert data["total_requests"] == 42
+            assert data["sources"] == {"external": 30, "webapp": 12}
+            assert len(data["timeline"]) == 2
+            assert data["timeline"][0]["requests"] == 5
+
+
+class TestStatsTemplateRendering:
     """Test that the stats template renders the feature flag and clickable counts correctly."""
 
-    def setUp(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
-
-    def tearDown(self):
-        os.environ.pop("SHOW_DOMAIN_CHECK_HISTORY", None)
-
-    def _reload_app(self):
-        import importlib
-        import app as app_module
-
-        importlib.reload(app_module)
-        app_module.limiter.enabled = False
-        return app_module
-
-    def test_stats_page_renders_flag_false_by_default(self):
-        app_module = self._reload_app()
-        with app_module.app.test_client() as client:
-            response = client.get("/stats")
-            self.assertEqual(response.status_code, 200)
-            html = response.data.decode("utf-8")
-            self.assertIn("const SHOW_DOMAIN_CHECK_HISTORY = false", html)
-
-    def test_stats_page_renders_flag_true_when_enabled(self):
-        os.environ["SHOW_DOMAIN_CHECK_HISTORY"] = "true"
-        app_module = self._reload_app()
-        with app_module.app.test_client() as client:
-            response = client.get("/stats")
-            self.assertEqual(response.status_code, 200)
-            html = response.data.decode("utf-8")
-            self.assertIn("const SHOW_DOMAIN_CHECK_HISTORY = true", html)
-
-
-if __name__ == "__main__":
-    unittest.main()
+    def test_stats_page_renders_flag_false_by_default(self, client):
+        response = client.get("/stats")
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert "const SHOW_DOMAIN_CHECK_HISTORY = false" in html
+
+    def test_stats_page_renders_flag_true_when_enabled(self, client, history_enabled):
+        response = client.get("/stats")
+        assert response.status_code == 200
+        html = response.get_data(as_text=True)
+        assert "const SHOW_DOMAIN_CHECK_HISTORY = true" in html
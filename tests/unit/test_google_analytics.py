@@ -3,233 +3,193 @@ Unit tests for Google Analytics configuration and integration.
 Tests the GA configuration, validation, and template injection.
 """
 
-import os
-import unittest
-from unittest.mock import patch, MagicMock
-import sys
-
-# Add app directory to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../app"))
-
-
-class TestGoogleAnalyticsConfig(unittest.TestCase):
+import pytest
+from unittest.mock import patch
+
+from app import _TRUTHY, get_analytics_config, inject_analytics
+
+# Every spelling app accepts as true, in lower, upper and title case
+_TRUE_VALUES = tuple(
+    sorted({case(value) for value in _TRUTHY for case in (str, str.upper, str.title)})
+)
+_FALSE_VALUES = ("false", "False", "FALSE", "0", "no", "No", "NO", "")
+
+# Snippets the index page must contain when GA is enabled with G-PROD123
+_GA_ENABLED_MARKERS = (
+    "window.GA_ENABLED = true",
+    "G-PROD123",
+    "analytics.js",
+    "cookie-consent.js",
+)
+
+
+@pytest.fixture(autouse=True)
+def _clean_ga_env(monkeypatch):
+    """Start every test without GA settings; monkeypatch restores them after"""
+    monkeypatch.delenv("GA_ENABLED", raising=False)
+    monkeypatch.delenv("GA_TRACKING_ID", raising=False)
+
+
+# GA settings for each index page variant the template tests inspect
+_GA_PAGE_ENV = {
+    "enabled": {"GA_ENABLED": "true", "GA_TRACKING_ID": "G-PROD123"},
+    "disabled": {"GA_ENABLED": "false"},
+}
+
+
+@pytest.fixture(scope="module")
+def ga_index_pages(client):
+    """Render the index page once per GA configuration and share the responses"""
+    pages = {}
+    for name, env in _GA_PAGE_ENV.items():
+        with pytest.MonkeyPatch.context() as mp:
+            mp.delenv("GA_TRACKING_ID", raising=False)
+            for key, value in env.items():
+                mp.setenv(key, value)
+            pages[name] = client.get("/")
+    return pages
+
+
+class TestGoogleAnalyticsConfig:
     """Test Google Analytics configuration and validation"""
 
-    def setUp(self):
-        """Set up test fixtures"""
-        # Clear any existing environment variables
-        if "GA_ENABLED" in os.environ:
-            del os.environ["GA_ENABLED"]
-        if "GA_TRACKING_ID" in os.environ:
-            del os.environ["GA_TRACKING_ID"]
-
-    def tearDown(self):
-        """Clean up after tests"""
-        # Clear environment variables
-        if "GA_ENABLED" in os.environ:
-            del os.environ["GA_ENABLED"]
-        if "GA_TRACKING_ID" in os.environ:
-            del os.environ["GA_TRACKING_ID"]
-
     @patch("app.logger")
     def test_ga_disabled_by_default(self, mock_logger):
         """Test that GA is disabled by default"""
-        from app import get_analytics_config
-
         config = get_analytics_config()
 
-        self.assertFalse(config["ga_enabled"])
-        self.assertEqual(config["ga_tracking_id"], "")
+        assert config["ga_enabled"] is False
+        assert config["ga_tracking_id"] == ""
         mock_logger.debug.assert_called()
 
     @patch("app.logger")
-    def test_ga_enabled_with_tracking_id(self, mock_logger):
+    def test_ga_enabled_with_tracking_id(self, mock_logger, monkeypatch):
         """Test GA enabled with valid tracking ID"""
-        os.environ["GA_ENABLED"] = "true"
-        os.environ["GA_TRACKING_ID"] = "G-TEST123456"
-
-        from app import get_analytics_config
+        monkeypatch.setenv("GA_ENABLED", "true")
+        monkeypatch.setenv("GA_TRACKING_ID", "G-TEST123456")
 
         config = get_analytics_config()
 
-        self.assertTrue(config["ga_enabled"])
-        self.assertEqual(config["ga_tracking_id"], "G-TEST123456")
+        assert config["ga_enabled"] is True
+        assert config["ga_tracking_id"] == "G-TEST123456"
         mock_logger.debug.assert_called_with(
             "Google Analytics enabled with tracking ID: G-TEST123456"
         )
 
     @patch("app.logger")
-    def test_ga_enabled_without_tracking_id(self, mock_logger):
+    def test_ga_enabled_without_tracking_id(self, mock_logger, monkeypatch):
         """Test GA enabled but missing tracking ID logs error"""
-        os.environ["GA_ENABLED"] = "true"
+        monkeypatch.setenv("GA_ENABLED", "true")
         # GA_TRACKING_ID not set
 
-        from app import get_analytics_config
-
         config = get_analytics_config()
 
         # Should be disabled due to missing tracking ID
-        self.assertFalse(config["ga_enabled"])
-        self.assertEqual(config["ga_tracking_id"], "")
+        assert config["ga_enabled"] is False
+        assert config["ga_tracking_id"] == ""
 
         # Should log an error
         mock_logger.error.assert_called_once()
         error_call = mock_logger.error.call_args[0][0]
-        self.assertIn("GA_ENABLED is set to true", error_call)
-        self.assertIn("GA_TRACKING_ID is missing", error_call)
+        assert "GA_ENABLED is set to true" in error_call
+        assert "GA_TRACKING_ID is missing" in error_call
 
     @patch("app.logger")
-    def test_ga_enabled_with_empty_tracking_id(self, mock_logger):
+    def test_ga_enabled_with_empty_tracking_id(self, mock_logger, monkeypatch):
         """Test GA enabled with empty tracking ID"""
-        os.environ["GA_ENABLED"] = "true"
-        os.environ["GA_TRACKING_ID"] = ""
-
-        from app import get_analytics_config
+        monkeypatch.setenv("GA_ENABLED", "true")
+        monkeypatch.setenv("GA_TRACKING_ID", "")
 
         config = get_analytics_config()
 
         # Should be disabled due to empty tracking ID
-        self.assertFalse(config["ga_enabled"])
+        assert config["ga_enabled"] is False
         mock_logger.error.assert_called_once()
 
+    # get_analytics_config() reads the environment on every call, so no
+    # module reload is needed between values
+    @pytest.mark.parametrize("value", _TRUE_VALUES)
     @patch("app.logger")
-    def test_ga_enabled_various_true_values(self, mock_logger):
+    def test_ga_enabled_various_true_values(self, mock_logger, value, monkeypatch):
         """Test GA enabled with various true values"""
-        os.environ["GA_TRACKING_ID"] = "G-TEST123456"
-
-        true_values = ["true", "True", "TRUE", "1", "yes", "Yes", "YES"]
-
-        for value in true_values:
-            os.environ["GA_ENABLED"] = value
+        monkeypatch.setenv("GA_TRACKING_ID", "G-TEST123456")
+        monkeypatch.setenv("GA_ENABLED", value)
 
-            # Reload module to get fresh config
-            import importlib
-            import app as app_module
-
-            importlib.reload(app_module)
-
-            config = app_module.get_analytics_config()
-            self.assertTrue(config["ga_enabled"], f"Failed for GA_ENABLED={value}")
+        assert get_analytics_config()["ga_enabled"] is True
 
+    @pytest.mark.parametrize("value", _FALSE_VALUES)
     @patch("app.logger")
-    def test_ga_disabled_various_false_values(self, mock_logger):
+    def test_ga_disabled_various_false_values(self, mock_logger, value, monkeypatch):
         """Test GA disabled with various false values"""
-        os.environ["GA_TRACKING_ID"] = "G-TEST123456"
-
-        false_values = ["false", "False", "FALSE", "0", "no", "No", "NO", ""]
+        monkeypatch.setenv("GA_TRACKING_ID", "G-TEST123456")
+        monkeypatch.setenv("GA_ENABLED", value)
 
-        for value in false_values:
-            os.environ["GA_ENABLED"] = value
+        assert get_analytics_config()["ga_enabled"] is False
 
-            # Reload module to get fresh config
-            import importlib
-            import app as app_module
 
-            importlib.reload(app_module)
-
-            config = app_module.get_analytics_config()
-            self.assertFalse(config["ga_enabled"], f"Failed for GA_ENABLED={value}")
-
-
-class TestGoogleAnalyticsTemplateIntegration(unittest.TestCase):
+class TestGoogleAnalyticsTemplateIntegration:
     """Test Google Analytics template integration"""
 
-    def setUp(self):
-        """Set up test Flask app"""
-        # Clear environment variables
-        if "GA_ENABLED" in os.environ:
-            del os.environ["GA_ENABLED"]
-        if "GA_TRACKING_ID" in os.environ:
-            del os.environ["GA_TRACKING_ID"]
-
-    def tearDown(self):
-        """Clean up after tests"""
-        if "GA_ENABLED" in os.environ:
-            del os.environ["GA_ENABLED"]
-        if "GA_TRACKING_ID" in os.environ:
-            del os.environ["GA_TRACKING_ID"]
-
-    def test_inject_analytics_context_processor(self):
+    def test_inject_analytics_context_processor(self, monkeypatch):
         """Test that inject_analytics context processor returns correct config"""
-        os.environ["GA_ENABLED"] = "true"
-        os.environ["GA_TRACKING_ID"] = "G-TEST123456"
-
-        from app import inject_analytics
+        monkeypatch.setenv("GA_ENABLED", "true")
+        monkeypatch.setenv("GA_TRACKING_ID", "G-TEST123456")
 
         result = inject_analytics()
 
-        self.assertIn("ga_enabled", result)
-        self.assertIn("ga_tracking_id", result)
-        self.assertTrue(result["ga_enabled"])
-        self.assertEqual(result["ga_tracking_id"], "G-TEST123456")
+        assert "ga_enabled" in result
+        assert "ga_tracking_id" in result
+        assert result["ga_enabled"] is True
+        assert result["ga_tracking_id"] == "G-TEST123456"
 
-    def test_ga_config_available_in_templates(self):
+    # The context processor reads the GA settings per request, so the shared
+    # session client renders each configuration without an app reload
+    def test_ga_config_available_in_templates(self, ga_index_pages):
         """Test that GA config is available in Flask templates"""
-        os.environ["GA_ENABLED"] = "true"
-        os.environ["GA_TRACKING_ID"] = "G-PROD123"
-
-        # Import after setting env vars
-        import importlib
-        import app as app_module
-
-        importlib.reload(app_module)
-
-        with app_module.app.test_client() as client:
-            response = client.get("/")
-            self.assertEqual(response.status_code, 200)
+        response = ga_index_pages["enabled"]
+        assert response.status_code == 200
 
-            # Check that GA variables are in the response
-            html = response.data.decode("utf-8")
-            self.assertIn("window.GA_ENABLED = true", html)
-            self.assertIn("G-PROD123", html)
-            self.assertIn("analytics.js", html)
-            self.assertIn("cookie-consent.js", html)
+        # Check that GA variables are in the response
+        html = response.get_data(as_text=True)
+        missing = [needle for needle in _GA_ENABLED_MARKERS if needle not in html]
+        assert not missing, missing
 
-    def test_ga_disabled_in_templates(self):
+    def test_ga_disabled_in_templates(self, ga_index_pages):
         """Test that GA scripts are not loaded when disabled"""
-        os.environ["GA_ENABLED"] = "false"
+        response = ga_index_pages["disabled"]
+        assert response.status_code == 200
 
-        # Import after setting env vars
-        import importlib
-        import app as app_module
+        # Check that GA is disabled
+        html = response.get_data(as_text=True)
+        assert "window.GA_ENABLED = false" in html
+        # Cookie consent should not be loaded when GA is disabled
+        assert "cookie-consent.js" not in html
 
-        importlib.reload(app_module)
 
-        with app_module.app.test_client() as client:
-            response = client.get("/")
-            self.assertEqual(response.status_code, 200)
-
-            # Check that GA is disabled
-            html = response.data.decode("utf-8")
-            self.assertIn("window.GA_ENABLED = false", html)
-            # Cookie consent should not be loaded when GA is disabled
-            self.assertNotIn("cookie-consent.js", html)
-
-
-class TestGoogleAnalyticsCSP(unittest.TestCase):
+class TestGoogleAnalyticsCSP:
     """Test Content Security Policy for Google Analytics"""
 
-    def test_csp_includes_ga_domains(self):
+    # Talisman sets the same CSP on every response, so reuse the cached page
+    def test_csp_includes_ga_domains(self, ga_index_pages):
         """Test that CSP headers include Google Analytics domains"""
-        import importlib
-        import app as app_module
+        response = ga_index_pages["disabled"]
 
-        importlib.reload(app_module)
+        # Check CSP header
+        csp_header = response.headers.get("Content-Security-Policy")
+        assert csp_header is not None
 
-        with app_module.app.test_client() as client:
-            response = client.get("/")
+        # Check for GA domains in script-src
+        assert "www.googletagmanager.com" in csp_header
+        assert "www.google-analytics.com" in csp_header
 
-            # Check CSP header
-            csp_header = response.headers.get("Content-Security-Policy")
-            self.assertIsNotNone(csp_header)
+        # Check for GA domains in connect-src
+        assert "connect-src" in csp_header
 
-            # Check for GA domains in script-src
-            self.assertIn("www.googletagmanager.com", csp_header)
-            self.assertIn("www.google-analytics.com", csp_header)
+    def test_csp_independent_of_ga_setting(self, ga_index_pages):
+        """Test that the CSP is static, so one cached response covers both modes"""
+        enabled, disabled = ga_index_pages["enabled"], ga_index_pages["disabled"]
 
-            # Check for GA domains in connect-src
-            self.assertIn("connect-src", csp_header)
-
-
-if __name__ == "__main__":
-    unittest.main()
+        assert (
+            enabled.headers["Content-Security-Policy"]
+            == disabled.headers["Content-Security-Policy"]
+        )
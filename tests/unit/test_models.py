@@ -3,98 +3,187 @@ Unit tests for models (InfluxDB logger).
 Tests database operations with mocked InfluxDB client.
 """
 
-import pytest
-from unittest.mock import patch, MagicMock, Mock
-import sys
-import os
+import dataclasses
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "app"))
+import pytest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from datetime import datetime
+
+from influxdb_client import InfluxDBClient, Point, WritePrecision
+from influxdb_client.client.query_api import QueryApi
+from influxdb_client.client.write_api import WriteApi
+from influxdb_client.rest import ApiException
+
+from models import (
+    InfluxConfig,
+    InfluxDBLogger,
+    RequestLog,
+    _MIN_FLUSH_INTERVAL,
+    _format_time_bucket,
+    _lp_format,
+    _request_count_query,
+)
+
+
+def _query_result(*rows):
+    """Build the streamed Flux records whose values are *rows*."""
+    return [SimpleNamespace(values=row) for row in rows]
+
+
+@pytest.fixture
+def influx_client_class(mocker):
+    """Patch ``models.InfluxDBClient`` with a mock returning a healthy client."""
+    client_class = mocker.patch("models.InfluxDBClient")
+    # spec_set keeps the mocks to the real client surface, so a typo'd
+    # attribute fails loudly instead of synthesizing a new child mock
+    client = MagicMock(spec_set=InfluxDBClient)
+    client.health.return_value = SimpleNamespace(status="pass", message="OK")
+    client.write_api.return_value = MagicMock(spec_set=WriteApi)
+    client.query_api.return_value = MagicMock(spec_set=QueryApi)
+    client_class.return_value = client
+    return client_class
+
+
+@pytest.fixture
+def mock_influx_client(influx_client_class):
+    """The client instance the patched ``InfluxDBClient`` hands out."""
+    return influx_client_class.return_value
+
+
+@pytest.fixture
+def make_logger():
+    """Build loggers from an explicit config and close them after the test.
+
+    The flush interval is long enough that the background flusher never
+    fires on its own mid-test, and the ambient INFLUX_* environment is
+    ignored.
+    """
+    loggers = []
+
+    def make(**overrides):
+        overrides.setdefault("flush_interval", 60.0)
+        logger = InfluxDBLogger(InfluxConfig(**overrides))
+        loggers.append(logger)
+        return logger
+
+    yield make
+    for logger in loggers:
+        logger.close()
+
+
+@pytest.fixture
+def mock_logger(mocker):
+    """Patch the module-level ``influx_logger`` that RequestLog delegates to."""
+    return mocker.patch("models.influx_logger")
 
 
 @pytest.mark.unit
 class TestInfluxDBLogger:
     """Test InfluxDBLogger class."""
 
-    def test_init_default_config(self):
+    def test_init_default_config(self, monkeypatch):
         """Test logger initialization with default configuration."""
-        with patch.dict(os.environ, {}, clear=True):
-            from models import InfluxDBLogger
-
-            logger = InfluxDBLogger()
-            assert logger.url == "http://localhost:8086"
-            assert logger.token == "dev-token"
-            assert logger.org == "dnssec-validator"
-            assert logger.bucket == "requests"
+        for key in ("INFLUX_URL", "INFLUX_TOKEN", "INFLUX_ORG", "INFLUX_BUCKET"):
+            monkeypatch.delenv(key, raising=False)
+        logger = InfluxDBLogger()
+        assert logger.url == "http://localhost:8086"
+        assert logger.token == "dev-token"
+        assert logger.org == "dnssec-validator"
+        assert logger.bucket == "requests"
 
-    def test_init_custom_config(self):
+    def test_init_custom_config(self, monkeypatch):
         """Test logger initialization with custom configuration."""
-        with patch.dict(
-            os.environ,
-            {
-                "INFLUX_URL": "http://custom:8086",
-                "INFLUX_TOKEN": "custom-token",
-                "INFLUX_ORG": "custom-org",
-                "INFLUX_BUCKET": "custom-bucket",
-            },
-        ):
-            from models import InfluxDBLogger
-
-            logger = InfluxDBLogger()
-            assert logger.url == "http://custom:8086"
-            assert logger.token == "custom-token"
-            assert logger.org == "custom-org"
-            assert logger.bucket == "custom-bucket"
-
-    @patch("models.InfluxDBClient")
-    def test_client_property_success(self, mock_influx_client_class):
-        """Test client property creates and returns client."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_health = Mock(status="pass", message="OK")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
-
+        monkeypatch.setenv("INFLUX_URL", "http://custom:8086")
+        monkeypatch.setenv("INFLUX_TOKEN", "custom-token")
+        monkeypatch.setenv("INFLUX_ORG", "custom-org")
+        monkeypatch.setenv("INFLUX_BUCKET", "custom-bucket")
         logger = InfluxDBLogger()
+        assert logger.url == "http://custom:8086"
+        assert logger.token == "custom-token"
+        assert logger.org == "custom-org"
+        assert logger.bucket == "custom-bucket"
+
+    def test_init_explicit_config(self, monkeypatch):
+        """Test an explicit config takes precedence over the environment."""
+        monkeypatch.setenv("INFLUX_BUCKET", "env-bucket")
+        config = InfluxConfig(url="http://explicit:8086", batch_size=1)
+
+        logger = InfluxDBLogger(config)
+
+        assert logger.url == "http://explicit:8086"
+        assert logger.bucket == "requests"
+        assert logger.config.batch_size == 1
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.url = "http://other:8086"
+
+    def test_client_property_success(
+        self, make_logger, influx_client_class, mock_influx_client
+    ):
+        """Test client property creates and returns client."""
+        logger = make_logger()
         client = logger.client
 
         assert client is not None
-        mock_influx_client_class.assert_called_once()
-        mock_client.health.assert_called_once()
-
-    @patch("models.InfluxDBClient")
-    def test_client_property_health_fail(self, mock_influx_client_class):
+        # Later accesses reuse the client without another health probe
+        assert logger.client is client
+        influx_client_class.assert_called_once()
+        assert influx_client_class.call_args.kwargs["enable_gzip"] is True
+        mock_influx_client.health.assert_called_once()
+
+    def test_write_api_reused_across_flushes(self, make_logger, mock_influx_client):
+        """Test that repeated flushes share one client and write API."""
+        logger = make_logger()
+        for i in range(10):
+            logger.log_request("1.2.3.4", f"d{i}.dk", 200, "valid", "api")
+            logger.flush()
+
+        assert mock_influx_client.write_api.call_count == 1
+        assert mock_influx_client.write_api.return_value.write.call_count == 10
+
+    def test_client_property_health_fail(self, make_logger, mock_influx_client):
         """Test client property when health check fails."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_health = Mock(status="fail", message="Unhealthy")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        mock_influx_client.health.return_value = SimpleNamespace(
+            status="fail", message="Unhealthy"
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         client = logger.client
 
         assert client is not None
-        mock_client.health.assert_called_once()
+        mock_influx_client.health.assert_called_once()
 
-    @patch("models.InfluxDBClient")
-    def test_client_property_connection_error(self, mock_influx_client_class):
+    def test_client_property_connection_error(self, make_logger, influx_client_class):
         """Test client property when connection fails."""
-        from models import InfluxDBLogger
+        influx_client_class.side_effect = Exception("Connection failed")
 
-        mock_influx_client_class.side_effect = Exception("Connection failed")
-
-        logger = InfluxDBLogger()
+        logger = make_logger()
         client = logger.client
 
         assert client is None
 
-    def test_log_request_no_client(self):
+    def test_client_property_retries_after_interval(
+        self, make_logger, influx_client_class, monkeypatch
+    ):
+        """Test a failed connection is retried only after the retry interval."""
+        clock = iter([100.0, 110.0, 131.0])
+        monkeypatch.setattr("models._monotonic", lambda: next(clock))
+        influx_client_class.side_effect = Exception("Connection failed")
+
+        logger = make_logger()
+        assert logger.client is None
+        # Within the interval: no new connection attempt
+        assert logger.client is None
+        influx_client_class.assert_called_once()
+
+        influx_client_class.side_effect = None
+        assert logger.client is not None
+        assert influx_client_class.call_count == 2
+
+    def test_log_request_no_client(self, make_logger, influx_client_class):
         """Test log_request when client is not available."""
-        from models import InfluxDBLogger
-
-        logger = InfluxDBLogger()
+        influx_client_class.side_effect = Exception("Connection failed")
+        logger = make_logger()
         logger._write_api = None
 
         result = logger.log_request(
@@ -107,19 +196,9 @@ class TestInfluxDBLogger:
 
         assert result is False
 
-    @patch("models.InfluxDBClient")
-    def test_log_request_success(self, mock_influx_client_class):
+    def test_log_request_success(self, make_logger, mock_influx_client):
         """Test successful request logging."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_write_api = MagicMock()
-        mock_client.write_api.return_value = mock_write_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
-
-        logger = InfluxDBLogger()
+        logger = make_logger()
         result = logger.log_request(
             ip_address="192.168.1.1",
             domain="bondit.dk",
@@ -132,21 +211,53 @@ class TestInfluxDBLogger:
         )
 
         assert result is True
-        mock_write_api.write.assert_called_once()
+        write = mock_influx_client.write_api.return_value.write
+        # Points are buffered until the next flush
+        write.assert_not_called()
+
+        assert logger.flush() is True
+        write.assert_called_once()
+        line = write.call_args.kwargs["record"]
+        assert line.startswith(
+            "request,client=webapp,dnssec_status=valid,domain=bondit.dk,"
+            "internal=false,ip_address=192.168.1.1,request_type=basic,source=api "
+            'count=1i,http_status=200i,user_agent="TestAgent/1.0" '
+        )
 
-    @patch("models.InfluxDBClient")
-    def test_log_request_with_internal_flag(self, mock_influx_client_class):
-        """Test request logging with internal flag."""
-        from models import InfluxDBLogger
+    def test_lp_format_matches_point(self):
+        """Test hand-built line protocol matches influxdb_client's Point."""
+        args = {
+            "ip_address": "10.0.0.1",
+            "domain": "a b,c=d.dk",
+            "http_status": 400,
+            "dnssec_status": "invalid",
+            "source": "webapp",
+            "user_agent": 'Agent "quoted" \\ path',
+            "client": "external",
+            "request_type": None,
+            "internal": True,
+            "timestamp_ns": 1_700_000_000_000_000_000,
+        }
+        point = (
+            Point("request")
+            .tag("domain", args["domain"])
+            .tag("source", args["source"])
+            .tag("client", args["client"])
+            .tag("dnssec_status", args["dnssec_status"])
+            .tag("ip_address", args["ip_address"])
+            .tag("internal", "true")
+            .field("http_status", args["http_status"])
+            .field("count", 1)
+            .field("user_agent", args["user_agent"])
+            .time(args["timestamp_ns"], WritePrecision.NS)
+        )
 
-        mock_client = MagicMock()
-        mock_write_api = MagicMock()
-        mock_client.write_api.return_value = mock_write_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        assert _lp_format(**args) == point.to_line_protocol()
 
-        logger = InfluxDBLogger()
+    @pytest.mark.usefixtures("mock_influx_client")
+    def test_log_request_with_internal_flag(self, make_logger):
+        """Test request logging with internal flag."""
+        logger = make_logger()
         result = logger.log_request(
             ip_address="127.0.0.1",
             domain="test.dk",
@@ -158,20 +269,13 @@ class TestInfluxDBLogger:
 
         assert result is True
 
-    @patch("models.InfluxDBClient")
-    def test_log_request_error(self, mock_influx_client_class):
-        """Test log_request error handling."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_write_api = MagicMock()
-        mock_write_api.write.side_effect = Exception("Write error")
-        mock_client.write_api.return_value = mock_write_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+    def test_log_request_error(self, make_logger, mock_influx_client):
+        """Test a failed batch write is reported by flush."""
+        mock_influx_client.write_api.return_value.write.side_effect = Exception(
+            "Write error"
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         result = logger.log_request(
             ip_address="192.168.1.1",
             domain="bondit.dk",
@@ -180,188 +284,269 @@ class TestInfluxDBLogger:
             source="api",
         )
 
-        assert result is False
-
-    @patch("models.InfluxDBClient")
-    def test_get_requests_count(self, mock_influx_client_class):
-        """Test getting request count."""
-        from models import InfluxDBLogger
+        assert result is True
+        assert logger.flush() is False
 
-        mock_client = MagicMock()
-        mock_query_api = MagicMock()
+    def test_log_request_unbatched(self, make_logger, mock_influx_client):
+        """Test a batch size of 1 writes each request immediately."""
+        write = mock_influx_client.write_api.return_value.write
+        write.side_effect = Exception("Write error")
 
-        # Mock query results
-        mock_record = Mock()
-        mock_record.values = {"_value": 42}
-        mock_table = Mock()
-        mock_table.records = [mock_record]
-        mock_query_api.query.return_value = [mock_table]
+        logger = make_logger(batch_size=1)
+        result = logger.log_request(
+            ip_address="192.168.1.1",
+            domain="bondit.dk",
+            http_status=200,
+            dnssec_status="valid",
+            source="api",
+        )
 
-        mock_client.query_api.return_value = mock_query_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        assert result is False
+        write.assert_called_once()
+
+    def test_flush_writes_in_batches(self, make_logger, mock_influx_client):
+        """Test flush drains the buffer in batch_size chunks."""
+        logger = make_logger(batch_size=2)
+        logger._batcher._queue.extend("abcde")
+
+        assert logger.flush() is True
+
+        write = mock_influx_client.write_api.return_value.write
+        batches = [call.kwargs["record"] for call in write.call_args_list]
+        assert batches == ["a\nb", "c\nd", "e"]
+        assert not logger._batcher._queue
+
+    def test_transient_write_failure_requeues_batch(
+        self, make_logger, mock_influx_client, capsys
+    ):
+        """Test a server error keeps the batch buffered and backs off quietly."""
+        write = mock_influx_client.write_api.return_value.write
+        write.side_effect = ApiException(status=503)
+        logger = make_logger(batch_size=2)
+        logger._batcher._queue.extend("abc")
+
+        assert logger.flush() is False
+        assert list(logger._batcher._queue) == ["a", "b", "c"]
+        capsys.readouterr()
+
+        # Still backing off: nothing is written and nothing is printed
+        assert logger.flush() is False
+        assert write.call_count == 1
+        assert capsys.readouterr().out == ""
+
+        logger._client_checked_at = None
+        write.side_effect = None
+        assert logger.flush() is True
+        batches = [call.kwargs["record"] for call in write.call_args_list]
+        assert batches == ["a\nb", "a\nb", "c"]
+
+    def test_rejected_batch_is_dropped(self, make_logger, mock_influx_client):
+        """Test a batch InfluxDB rejects does not block the ones behind it."""
+        write = mock_influx_client.write_api.return_value.write
+        write.side_effect = [ApiException(status=400), None]
+        logger = make_logger(batch_size=2)
+        logger._batcher._queue.extend("abc")
+
+        assert logger.flush() is False
+        assert not logger._batcher._queue
+        batches = [call.kwargs["record"] for call in write.call_args_list]
+        assert batches == ["a\nb", "c"]
+
+    @pytest.mark.parametrize("interval", [0, -1.0])
+    def test_flush_interval_clamped(self, interval):
+        """Test non-positive flush intervals cannot make the flusher spin."""
+        config = InfluxConfig(flush_interval=interval)
+
+        assert config.flush_interval == _MIN_FLUSH_INTERVAL
+
+    def test_close_stops_flush_thread(self, make_logger, mock_influx_client):
+        """Test close() flushes the buffer and stops the flusher thread."""
+        logger = make_logger()
+        logger.log_request("1.2.3.4", "bondit.dk", 200, "valid", "api")
+        thread = logger._batcher._thread
+        assert thread.is_alive()
+
+        logger.close()
+
+        assert not thread.is_alive()
+        mock_influx_client.write_api.return_value.write.assert_called_once()
+
+    def test_get_requests_count(self, make_logger, mock_influx_client):
+        """Test getting request count."""
+        mock_query_api = mock_influx_client.query_api.return_value
+        mock_query_api.query_stream.return_value = _query_result({"_value": 42})
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         count = logger.get_requests_count(hours=24)
 
         assert count == 42
-        mock_query_api.query.assert_called_once()
+        mock_query_api.query_stream.assert_called_once()
 
-    @patch("models.InfluxDBClient")
-    def test_get_requests_count_with_source(self, mock_influx_client_class):
+    def test_get_requests_count_with_source(self, make_logger, mock_influx_client):
         """Test getting request count filtered by source."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_query_api = MagicMock()
-        mock_record = Mock()
-        mock_record.values = {"_value": 10}
-        mock_table = Mock()
-        mock_table.records = [mock_record]
-        mock_query_api.query.return_value = [mock_table]
-        mock_client.query_api.return_value = mock_query_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        mock_influx_client.query_api.return_value.query_stream.return_value = (
+            _query_result({"_value": 10})
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         count = logger.get_requests_count(days=7, source="api")
 
         assert count == 10
 
-    @patch("models.InfluxDBClient")
-    def test_get_requests_count_no_query_api(self, mock_influx_client_class):
+    @pytest.mark.usefixtures("mock_influx_client")
+    def test_get_requests_count_no_query_api(self, make_logger):
         """Test getting request count when query API not available."""
-        from models import InfluxDBLogger
-
-        logger = InfluxDBLogger()
+        logger = make_logger()
         logger._query_api = None
 
         count = logger.get_requests_count(hours=1)
 
         assert count == 0
 
-    @patch("models.InfluxDBClient")
-    def test_get_top_domains(self, mock_influx_client_class):
+    def test_request_count_query_reused(self, make_logger, mock_influx_client):
+        """Test repeated periods reuse the cached Flux query prefix."""
+        query = mock_influx_client.query_api.return_value.query_stream
+        query.return_value = _query_result({"_value": 1})
+        _request_count_query.cache_clear()
+
+        logger = make_logger()
+        logger.get_requests_count(hours=24, source="api")
+        logger.get_requests_count(hours=24, source="api")
+        logger.get_requests_count(hours=24, source="api", domain="bondit.dk")
+
+        assert _request_count_query.cache_info().misses == 1
+        assert _request_count_query.cache_info().hits == 2
+        first, second, with_domain = (call.args[0] for call in query.call_args_list)
+        assert first == second
+        assert 'r.domain == "bondit.dk"' in with_domain
+
+    def test_cleanup_old_logs_is_noop(self, make_logger, mock_influx_client):
+        """Test cleanup leaves the bucket and its data untouched."""
+        logger = make_logger()
+
+        assert logger.cleanup_old_logs(days=30) == 0
+        mock_influx_client.buckets_api.assert_not_called()
+        mock_influx_client.delete_api.assert_not_called()
+
+    def test_set_retention_days(self, make_logger, mock_influx_client):
+        """Test an explicit retention change replaces the bucket rule."""
+        buckets_api = mock_influx_client.buckets_api.return_value
+        bucket = SimpleNamespace(name="requests", retention_rules=[])
+        buckets_api.find_bucket_by_name.return_value = bucket
+
+        logger = make_logger()
+
+        assert logger.set_retention_days(30) is True
+        buckets_api.update_bucket.assert_called_once_with(bucket=bucket)
+        (rule,) = bucket.retention_rules
+        assert rule.every_seconds == 30 * 24 * 60 * 60
+
+    @pytest.mark.parametrize("days", [0, -1])
+    def test_set_retention_days_rejects_below_minimum(
+        self, make_logger, mock_influx_client, days
+    ):
+        """Test retention periods below InfluxDB's minimum are rejected."""
+        logger = make_logger()
+
+        assert logger.set_retention_days(days) is False
+        mock_influx_client.buckets_api.assert_not_called()
+
+    def test_get_top_domains(self, make_logger, mock_influx_client):
         """Test getting top domains."""
-        from models import InfluxDBLogger
-
-        mock_client = MagicMock()
-        mock_query_api = MagicMock()
-
-        mock_record1 = Mock()
-        mock_record1.values = {"domain": "bondit.dk", "_value": 50}
-        mock_record2 = Mock()
-        mock_record2.values = {"domain": "example.com", "_value": 30}
-
-        mock_table = Mock()
-        mock_table.records = [mock_record1, mock_record2]
-        mock_query_api.query.return_value = [mock_table]
-
-        mock_client.query_api.return_value = mock_query_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        mock_influx_client.query_api.return_value.query_stream.return_value = (
+            _query_result(
+                {"domain": "bondit.dk", "_value": 50},
+                {"domain": "example.com", "_value": 30},
+            )
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         top_domains = logger.get_top_domains(limit=10, days=30)
 
         assert len(top_domains) == 2
         assert top_domains[0] == ("bondit.dk", 50)
         assert top_domains[1] == ("example.com", 30)
-
-
-@pytest.mark.unit
-class TestRequestLogCompatibility:
-    """Test RequestLog compatibility layer."""
-
-    @patch("models.influx_logger")
-    def test_log_request(self, mock_logger):
-        """Test RequestLog.log_request calls influx_logger."""
-        from models import RequestLog
-
-        mock_logger.log_request.return_value = True
-
-        result = RequestLog.log_request(
-            ip_address="192.168.1.1",
-            domain="bondit.dk",
-            http_status=200,
-            dnssec_status="valid",
-            source="api",
+        # Ranking and truncation happen server-side
+        query = mock_influx_client.query_api.return_value.query_stream
+        assert 'top(n: 10, columns: ["_value"])' in query.call_args.args[0]
+
+    def test_execute_query_projects_columns(self, make_logger, mock_influx_client):
+        """Test that requested columns come back as tuples in column order."""
+        mock_influx_client.query_api.return_value.query_stream.return_value = (
+            _query_result(
+                {"domain": "bondit.dk", "_value": 50, "result": "_result"},
+                {"_value": 7},
+            )
         )
 
-        assert result is True
-        mock_logger.log_request.assert_called_once()
-
-    @patch("models.influx_logger")
-    def test_get_requests_count(self, mock_logger):
-        """Test RequestLog.get_requests_count calls influx_logger."""
-        from models import RequestLog
-
-        mock_logger.get_requests_count.return_value = 100
-
-        result = RequestLog.get_requests_count(hours=24)
-
-        assert result == 100
-        mock_logger.get_requests_count.assert_called_once_with(24, None, None)
+        logger = make_logger()
+        rows = logger._execute_query("from()", columns=("domain", "_value"))
 
-    @patch("models.influx_logger")
-    def test_get_top_domains(self, mock_logger):
-        """Test RequestLog.get_top_domains calls influx_logger."""
-        from models import RequestLog
+        assert rows == [("bondit.dk", 50), (None, 7)]
 
-        mock_logger.get_top_domains.return_value = [("bondit.dk", 50)]
 
-        result = RequestLog.get_top_domains(limit=10, days=30)
-
-        assert len(result) == 1
-        assert result[0] == ("bondit.dk", 50)
-
-    @patch("models.influx_logger")
-    def test_cleanup_old_logs(self, mock_logger):
-        """Test RequestLog.cleanup_old_logs calls influx_logger."""
-        from models import RequestLog
-
-        mock_logger.cleanup_old_logs.return_value = 42
-
-        result = RequestLog.cleanup_old_logs(days=90)
+@pytest.mark.unit
+class TestRequestLogCompatibility:
+    """Test RequestLog compatibility layer."""
 
-        assert result == 42
-        mock_logger.cleanup_old_logs.assert_called_once_with(90)
+    @pytest.mark.parametrize(
+        "method,kwargs,return_value,expected_args",
+        [
+            (
+                "log_request",
+                {
+                    "ip_address": "192.168.1.1",
+                    "domain": "bondit.dk",
+                    "http_status": 200,
+                    "dnssec_status": "valid",
+                    "source": "api",
+                },
+                True,
+                ("192.168.1.1", "bondit.dk", 200, "valid", "api", None),
+            ),
+            ("get_requests_count", {"hours": 24}, 100, (24, None, None)),
+            (
+                "get_top_domains",
+                {"limit": 10, "days": 30},
+                [("bondit.dk", 50)],
+                (10, 30),
+            ),
+            ("cleanup_old_logs", {"days": 90}, 42, (90,)),
+        ],
+        ids=["log_request", "get_requests_count", "get_top_domains", "cleanup"],
+    )
+    def test_delegates_to_influx_logger(
+        self, mock_logger, method, kwargs, return_value, expected_args
+    ):
+        """Test RequestLog classmethods delegate to influx_logger."""
+        delegate = getattr(mock_logger, method)
+        delegate.return_value = return_value
+
+        result = getattr(RequestLog, method)(**kwargs)
+
+        assert result == return_value
+        delegate.assert_called_once_with(*expected_args)
 
 
 @pytest.mark.unit
 class TestInfluxDBLoggerHourlyRequests:
     """Test InfluxDBLogger hourly requests with date formatting."""
 
-    @patch("models.InfluxDBClient")
-    def test_get_hourly_requests_with_iso_timestamp(self, mock_influx_client_class):
+    def test_get_hourly_requests_with_iso_timestamp(
+        self, make_logger, mock_influx_client
+    ):
         """Test hourly requests returns ISO timestamps for short periods."""
-        from models import InfluxDBLogger
-        from datetime import datetime
-
-        mock_client = MagicMock()
-        mock_query_api = MagicMock()
-
         # Mock query results with datetime objects
-        mock_record1 = Mock()
         mock_time1 = datetime(2026, 1, 7, 10, 0, 0)
-        mock_record1.values = {"_time": mock_time1, "_value": 10}
-        mock_record2 = Mock()
         mock_time2 = datetime(2026, 1, 7, 11, 0, 0)
-        mock_record2.values = {"_time": mock_time2, "_value": 15}
-
-        mock_table = Mock()
-        mock_table.records = [mock_record1, mock_record2]
-        mock_query_api.query.return_value = [mock_table]
-
-        mock_client.query_api.return_value = mock_query_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        mock_influx_client.query_api.return_value.query_stream.return_value = (
+            _query_result(
+                {"_time": mock_time1, "_value": 10},
+                {"_time": mock_time2, "_value": 15},
+            )
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         # Test with 24 hours (should return ISO timestamps)
         result = logger.get_hourly_requests(hours=24, window_every="1h")
 
@@ -372,33 +557,19 @@ class TestInfluxDBLoggerHourlyRequests:
         assert result[1][0] == mock_time2.isoformat()
         assert result[1][1] == 15
 
-    @patch("models.InfluxDBClient")
-    def test_get_hourly_requests_with_date_only(self, mock_influx_client_class):
+    def test_get_hourly_requests_with_date_only(self, make_logger, mock_influx_client):
         """Test hourly requests returns date-only for 7d+ periods."""
-        from models import InfluxDBLogger
-        from datetime import datetime
-
-        mock_client = MagicMock()
-        mock_query_api = MagicMock()
-
         # Mock query results with datetime objects
-        mock_record1 = Mock()
         mock_time1 = datetime(2026, 1, 1, 0, 0, 0)
-        mock_record1.values = {"_time": mock_time1, "_value": 100}
-        mock_record2 = Mock()
         mock_time2 = datetime(2026, 1, 2, 0, 0, 0)
-        mock_record2.values = {"_time": mock_time2, "_value": 150}
-
-        mock_table = Mock()
-        mock_table.records = [mock_record1, mock_record2]
-        mock_query_api.query.return_value = [mock_table]
-
-        mock_client.query_api.return_value = mock_query_api
-        mock_health = Mock(status="pass")
-        mock_client.health.return_value = mock_health
-        mock_influx_client_class.return_value = mock_client
+        mock_influx_client.query_api.return_value.query_stream.return_value = (
+            _query_result(
+                {"_time": mock_time1, "_value": 100},
+                {"_time": mock_time2, "_value": 150},
+            )
+        )
 
-        logger = InfluxDBLogger()
+        logger = make_logger()
         # Test with 168 hours (7 days) and daily window (should return date-only)
         result = logger.get_hourly_requests(hours=168, window_every="1d")
 
@@ -409,11 +580,18 @@ class TestInfluxDBLoggerHourlyRequests:
         assert result[1][0] == "2026-01-02"
         assert result[1][1] == 150
 
-    @patch("models.influx_logger")
+    def test_time_bucket_format_cached(self):
+        """Test repeated window boundaries reuse the formatted string."""
+        bucket = datetime(2026, 1, 7, 10, 0, 0)
+
+        first = _format_time_bucket(bucket, False)
+
+        assert first == "2026-01-07T10:00:00"
+        assert _format_time_bucket(datetime(2026, 1, 7, 10, 0, 0), False) is first
+        assert _format_time_bucket(bucket, True) == "2026-01-07"
+
     def test_get_external_hourly_requests(self, mock_logger):
         """Test RequestLog.get_external_hourly_requests calls influx_logger."""
-        from models import RequestLog
-
         mock_logger.get_hourly_requests.return_value = [
             ("2026-01-01", 100),
             ("2026-01-02", 150),
@@ -3,14 +3,15 @@ Unit tests for TLSAValidator class.
 Tests TLSA/DANE validation logic with mocked dependencies.
 """
 
-import pytest
-from unittest.mock import patch, MagicMock, Mock
-import sys
-import os
+import hashlib
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "app"))
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "fixtures"))
+import dns.flags
+import dns.resolver
+import pytest
+from types import SimpleNamespace
+from unittest.mock import patch, MagicMock
 
+import tlsa_validator
 from tlsa_validator import TLSAValidator
 
 
@@ -50,14 +51,12 @@ class TestTLSAValidatorInit:
 class TestTLSAQuery:
     """Test TLSA DNS query methods."""
 
-    @patch("dns.resolver.Resolver")
-    def test_query_tlsa_records_success(self, mock_resolver_class):
+    @patch("tlsa_validator._shared_resolver")
+    def test_query_tlsa_records_success(self, shared_resolver):
         """Test successful TLSA record query."""
+        mock_resolver = shared_resolver.return_value
         validator = TLSAValidator("mail.bondit.dk")
 
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
-
         # Mock TLSA record
         mock_rr = MagicMock()
         mock_rr.usage = 3
@@ -69,8 +68,7 @@ class TestTLSAQuery:
         mock_rrset.ttl = 3600
         mock_rrset.__iter__ = lambda self: iter([mock_rr])
 
-        mock_answer = MagicMock()
-        mock_answer.rrset = mock_rrset
+        mock_answer = SimpleNamespace(rrset=mock_rrset)
         mock_resolver.resolve.return_value = mock_answer
 
         result = validator._query_tlsa_records(443, "tcp")
@@ -80,36 +78,58 @@ class TestTLSAQuery:
         assert result[0]["selector"] == 1
         assert result[0]["mtype"] == 1
 
-    @patch("dns.resolver.Resolver")
-    def test_query_tlsa_no_records(self, mock_resolver_class):
+    @patch("tlsa_validator._shared_resolver")
+    def test_query_tlsa_no_records(self, shared_resolver):
         """Test TLSA query when no records exist."""
+        mock_resolver = shared_resolver.return_value
         import dns.resolver
 
         validator = TLSAValidator("example.com")
 
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
         mock_resolver.resolve.side_effect = dns.resolver.NXDOMAIN()
 
         result = validator._query_tlsa_records(443, "tcp")
 
         assert result == []
 
-    @patch("dns.resolver.Resolver")
-    def test_query_tlsa_no_answer(self, mock_resolver_class):
+    @patch("tlsa_validator._shared_resolver")
+    def test_query_tlsa_no_answer(self, shared_resolver):
         """Test TLSA query when DNS returns no answer."""
+        mock_resolver = shared_resolver.return_value
         import dns.resolver
 
         validator = TLSAValidator("example.com")
 
-        mock_resolver = MagicMock()
-        mock_resolver_class.return_value = mock_resolver
         mock_resolver.resolve.side_effect = dns.resolver.NoAnswer()
 
         result = validator._query_tlsa_records(443, "tcp")
 
         assert result == []
 
+    def test_shared_resolver_caches_answers(self, monkeypatch):
+        """Test TLSA lookups share one lazily built resolver with a cache."""
+        tlsa_validator._shared_resolver.cache_clear()
+
+        resolver = tlsa_validator._shared_resolver()
+
+        assert tlsa_validator._shared_resolver() is resolver
+        assert isinstance(resolver.cache, dns.resolver.LRUCache)
+        assert resolver.ednsflags & dns.flags.DO
+
+    def test_resolver_configuration_error_is_per_request(self, monkeypatch):
+        """Test a missing resolver configuration fails the lookup, not import."""
+        tlsa_validator._shared_resolver.cache_clear()
+        monkeypatch.setattr(
+            dns.resolver,
+            "Resolver",
+            MagicMock(side_effect=dns.resolver.NoResolverConfiguration()),
+        )
+
+        result = TLSAValidator("example.com").validate_tlsa()
+
+        assert result["tlsa_status"] == "error"
+        assert tlsa_validator._shared_resolver.cache_info().currsize == 0
+
 
 @pytest.mark.unit
 class TestTLSAValidation:
@@ -219,6 +239,23 @@ class TestTLSAValidation:
         assert "computed_hash" in result
         assert result["match_details"]["data_source"] == "public_key_info"
 
+    def test_validate_single_association_matches_der_digest(self):
+        """Test that a selector 0 / SHA-256 record matches the DER hash."""
+        validator = TLSAValidator("test.dk")
+        der_data = b"\x30\x82" + bytes(range(256))
+
+        tlsa_record = {
+            "usage": 3,
+            "selector": 0,
+            "mtype": 1,
+            "cert_assoc_data": hashlib.sha256(der_data).hexdigest().upper(),
+        }
+        cert_info = {"der_data": der_data, "public_key_info": b"test_key"}
+
+        result = validator._validate_single_association(tlsa_record, cert_info)
+
+        assert result["valid"] is True
+
     def test_validate_single_association_unsupported_selector(self):
         """Test validation with unsupported selector."""
         validator = TLSAValidator("test.dk")
@@ -276,6 +313,27 @@ class TestTLSAValidation:
             assert len(result["valid_associations"]) == 1
             assert result["summary"]["success_rate"] == 100.0
 
+    def test_validate_dane_associations_hashes_once_per_selector(self):
+        """Test that records sharing parameters reuse the computed digest."""
+        validator = TLSAValidator("test.dk")
+        cert_info = {"der_data": b"test_cert", "public_key_info": b"test_key"}
+        spki_hash = hashlib.sha256(b"test_key").hexdigest()
+
+        tlsa_records = [
+            {"usage": 3, "selector": 1, "mtype": 1, "cert_assoc_data": "00" * 32},
+            {"usage": 3, "selector": 1, "mtype": 1, "cert_assoc_data": spki_hash},
+            {"usage": 2, "selector": 1, "mtype": 1, "cert_assoc_data": "11" * 32},
+            {"usage": 3, "selector": 0, "mtype": 1, "cert_assoc_data": "22" * 32},
+            {"usage": 2, "selector": 0, "mtype": 1, "cert_assoc_data": "33" * 32},
+        ]
+
+        with patch("tlsa_validator.hashlib.sha256", wraps=hashlib.sha256) as sha256:
+            result = validator._validate_dane_associations(tlsa_records, cert_info)
+
+        assert sha256.call_count == 2
+        assert result["summary"]["valid_associations"] == 1
+        assert result["summary"]["invalid_associations"] == 4
+
 
 @pytest.mark.unit
 class TestTLSACertificate: